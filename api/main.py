@@ -149,8 +149,9 @@ def _run_full_pipeline(portfolio_csv: str) -> dict:
     Mirrors demo.py exactly — same call order, same arguments.
     Returns a dict safe for JSON serialization.
     """
-    series = load_gpr_daily_from_csv(_GPR_CSV)
-    events = detect_gpr_events(series)
+    series = load_gpr_daily_from_csv(_GPR_CSV, use_feather_cache=True)
+    # Full series is identical between CSV syncs, so repeat requests reuse it
+    events = detect_gpr_events(series, use_cache=True)
 
     # Use the most recent event as the active event
     active_event = events[-1] if events else None
@@ -222,7 +223,7 @@ def gpr_series(preset: str = "5Y"):
       }
     """
     try:
-        series = load_gpr_daily_from_csv(_GPR_CSV)
+        series = load_gpr_daily_from_csv(_GPR_CSV, use_feather_cache=True)
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail="GPR CSV not found")
 
@@ -274,7 +275,7 @@ def gpr_latest():
       }
     """
     try:
-        series = load_gpr_daily_from_csv(_GPR_CSV)
+        series = load_gpr_daily_from_csv(_GPR_CSV, use_feather_cache=True)
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail="GPR CSV not found")
 
@@ -284,7 +285,7 @@ def gpr_latest():
     latest = series[-1]
 
     try:
-        events = detect_gpr_events(series)
+        events = detect_gpr_events(series, use_cache=True)
     except Exception:
         events = []
 
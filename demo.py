@@ -8,19 +8,19 @@ internal services in `gpr_overlay`.
 """
 from __future__ import annotations
 
-import json
 import sys
 import os
+from itertools import chain
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 from pathlib import Path
 from typing import Optional
-from collections import defaultdict
 
 try:
     import typer
-except Exception:
+except ImportError:
     typer = None
 
+from gpr_overlay.cli.json_output import write_json
 from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_from_csv
 from gpr_overlay.services.gpr_event_detection_service import (
     detect_gpr_events,
@@ -28,24 +28,13 @@ from gpr_overlay.services.gpr_event_detection_service import (
 )
 from gpr_overlay.services.portfolio_overlay_service import (
     load_portfolio_snapshot_from_csv,
+    compute_industry_shortlists,
     compute_portfolio_industry_exposure,
 )
 from gpr_overlay.services.industry_impact_service import compute_event_portfolio_impact
 from gpr_overlay.services.advisory_service import build_advisory_report
 
 
-def _serialize_model(m):
-    # Pydantic v2 -> model_dump_json available; fall back to json() or model_dump
-    if hasattr(m, "model_dump_json"):
-        return m.model_dump_json(indent=2)
-    if hasattr(m, "json"):
-        return m.json(indent=2, default=str)
-    try:
-        return json.dumps(m, indent=2, default=str)
-    except Exception:
-        return str(m)
-
-
 def run_analysis(
     gpr_file: str = "data/gpr_daily_sample.csv",
     portfolio_file: str = "data/LCTD_portfolio_2025-12-31.csv",
@@ -94,70 +83,44 @@ def run_analysis(
     advisory_path = out / f"advisory_{event_tag}.json"
     holdings_path = out / output_holdings
 
+    # Serialize the impact profile once; the holdings metadata below reuses
+    # its (already JSON-ready) event and composition sub-dicts.
+    impact_dump = impact_profile.model_dump(mode="json")
+
     print(f"Writing impact profile to {impact_path}")
-    with open(impact_path, "w", encoding="utf-8") as f:
-        if hasattr(impact_profile, "model_dump_json"):
-            f.write(impact_profile.model_dump_json(indent=2))
-        else:
-            f.write(json.dumps(impact_profile, default=str, indent=2))
+    write_json(impact_dump, impact_path)
 
     print(f"Writing advisory report to {advisory_path}")
-    with open(advisory_path, "w", encoding="utf-8") as f:
-        f.write(_serialize_model(report))
+    write_json(report.model_dump(mode="json"), advisory_path)
         
     # --- HOLDINGS SHORTLIST LOGIC ---
     print(f"Generating holdings shortlist to {holdings_path}...")
     
-    # 1. Extract raw holdings info
-    holdings_list = []
-    for h in snapshot.holdings:
-        holdings_list.append({
-            "security_name_report": h.security_name_report,
-            "weight_pct": h.weight_pct,
-            "fed_industry_name": h.fed_industry_name,
-            "region_guess": getattr(h, "region_guess", None),
-            "country_guess": getattr(h, "country_guess", None),
-        })
-
-    # 2. Identify relevant industries (Vulnerable + Resilient)
-    sel_industry_names = {it.fed_industry_name for it in (impact_profile.vulnerable_industries + impact_profile.resilient_industries)}
-
-    # 3. Group by industry
-    by_ind = defaultdict(list)
-    for item in holdings_list:
-        name = item.get("fed_industry_name")
-        if name in sel_industry_names:
-            by_ind[name].append(item)
-
-    # 4. Sort and pick Top 5 per industry
+    # 1. Identify relevant industries (Vulnerable + Resilient)
+    sel_industry_names = {it.fed_industry_name for it in chain(impact_profile.vulnerable_industries, impact_profile.resilient_industries)}
+
+    # 2. Top 5 holdings per industry by weight (industries in order of first appearance)
+    shortlist_holdings = compute_industry_shortlists(snapshot, sel_industry_names, 5)
+
+    # 3. Per-holding share of its industry's portfolio weight
+    industry_weights = {it.fed_industry_name: it.portfolio_weight for it in impact_profile.industries}
     shortlists = {}
-    for ind_name, items in by_ind.items():
-        # sort desc by weight
-        items_sorted = sorted(items, key=lambda x: float(x.get("weight_pct") or 0.0), reverse=True)
-        shortlists[ind_name] = items_sorted[:5]
-
-    # 5. Calculate per-holding industry share
-    ind_by_name = {it.fed_industry_name: it for it in impact_profile.industries}
-    for ind_name, items in shortlists.items():
-        ind_obj = ind_by_name.get(ind_name)
-        ind_pw = ind_obj.portfolio_weight if ind_obj else 0.0
-        for h in items:
-            hw = float(h.get("weight_pct") or 0.0)
-            h["industry_weight_share_for_holding"] = float(hw / ind_pw) if ind_pw > 0 else 0.0
-            
-    # 6. Construct final JSON
-    # Need basic event dict for metadata
-    ev_obj = {}
-    if hasattr(impact_profile.event, "model_dump"):
-        ev_obj = impact_profile.event.model_dump()
-    elif hasattr(impact_profile.event, "dict"):
-        ev_obj = impact_profile.event.dict()
-        
-    # Fix enum serialization if needed
-    if isinstance(ev_obj.get("event_type"), dict):
-         ev_obj["event_type"] = ev_obj["event_type"].get("value")
-    elif hasattr(impact_profile.event.event_type, "value"):
-         ev_obj["event_type"] = impact_profile.event.event_type.value
+    for name, holdings in shortlist_holdings.items():
+        ind_pw = industry_weights.get(name, 0.0)
+        shortlists[name] = [
+            {
+                "security_name_report": h.security_name_report,
+                "weight_pct": h.weight_pct,
+                "fed_industry_name": h.fed_industry_name,
+                "region_guess": h.region_guess,
+                "country_guess": h.country_guess,
+                "industry_weight_share_for_holding": h.weight_pct / ind_pw if ind_pw > 0 else 0.0,
+            }
+            for h in holdings
+        ]
+
+    # 4. Construct final JSON (event already has enum/date values serialized)
+    ev_obj = impact_dump["event"]
 
     holdings_output = {
         "meta": {
@@ -165,12 +128,11 @@ def run_analysis(
             "as_of_date": snapshot.as_of_date.isoformat(),
             "event": ev_obj,
         },
-        "vulnerability_composition": getattr(impact_profile, "vulnerability_composition", {}),
+        "vulnerability_composition": impact_dump["vulnerability_composition"],
         "shortlists_by_industry": shortlists
     }
     
-    with open(holdings_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps(holdings_output, indent=2, default=str))
+    write_json(holdings_output, holdings_path)
 
     print("Done.")
 
@@ -10,25 +10,8 @@ Tasks:
 import pandas as pd
 import os
 from pathlib import Path
-from collections import Counter
 
-
-def find_header_row(file_path, header_marker="Ticker"):
-    """
-    Find the row containing the actual header by looking for header_marker.
-    
-    Args:
-        file_path: Path to the CSV file
-        header_marker: String to identify the header row
-        
-    Returns:
-        Row number (0-indexed) where header starts
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for i, line in enumerate(f):
-            if header_marker in line:
-                return i
-    return None
+from holdings_csv import read_holdings_csv, split_holdings_file
 
 
 def analyze_lctd_holdings():
@@ -43,8 +26,8 @@ def analyze_lctd_holdings():
         print(f"ERROR: File not found at {file_path}")
         return
     
-    # Find the header row dynamically
-    header_row = find_header_row(file_path)
+    # Find the header row dynamically (single pass over the file)
+    header_row, csv_text = split_holdings_file(file_path)
     
     if header_row is None:
         print("ERROR: Could not find header row containing 'Ticker'")
@@ -54,7 +37,7 @@ def analyze_lctd_holdings():
     
     # Read the CSV with correct header row
     try:
-        df = pd.read_csv(file_path, skiprows=header_row)
+        df = read_holdings_csv(csv_text, usecols=["Sector"])
         print(f"INFO: Successfully read CSV with {len(df)} rows")
     except Exception as e:
         print(f"ERROR: Failed to read CSV: {e}")
@@ -73,16 +56,17 @@ def analyze_lctd_holdings():
     print(f"Total rows with Sector data: {len(sectors)}")
     print(f"Total rows in file: {len(df)}")
     
+    # Value counts in a single pass; stable sort keeps ties in order of appearance
+    sector_counts = sectors.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+    sector_pcts = sector_counts / sector_counts.sum() * 100
+    
     # Unique sectors
-    unique_sectors = sectors.unique()
-    print(f"\nUnique sectors found: {len(unique_sectors)}")
-    print(f"Sectors: {sorted(unique_sectors)}")
+    print(f"\nUnique sectors found: {len(sector_counts)}")
+    print(f"Sectors: {sorted(sector_counts.index)}")
     
-    # Value counts
-    sector_counts = Counter(sectors)
     print(f"\nSector distribution (value counts):")
-    for sector, count in sorted(sector_counts.items(), key=lambda x: x[1], reverse=True):
-        pct = (count / len(sectors)) * 100
+    for sector, count in sector_counts.items():
+        pct = sector_pcts[sector]
         print(f"  {sector:30s}: {count:3d} rows ({pct:5.2f}%)")
 
 
@@ -109,10 +93,9 @@ def analyze_synthetic_portfolio():
     if 'fed_industry_name' in df.columns:
         print(f"\n{'FED_INDUSTRY_NAME (Existing Taxonomy)':^80}")
         print("-" * 80)
-        industry_names = df['fed_industry_name'].dropna().unique()
-        print(f"Unique fed_industry_name values: {len(industry_names)}")
-        for name in sorted(industry_names):
-            count = (df['fed_industry_name'] == name).sum()
+        industry_counts = df['fed_industry_name'].value_counts().sort_index()
+        print(f"Unique fed_industry_name values: {len(industry_counts)}")
+        for name, count in industry_counts.items():
             pct = (count / len(df)) * 100
             print(f"  {name:40s}: {count:3d} rows ({pct:5.2f}%)")
     else:
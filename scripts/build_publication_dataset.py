@@ -5,10 +5,18 @@ Input: data/LCTD_holdings.csv
 Output: data/LCTD_portfolio_2025-12-31.csv
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from typing import Optional, Tuple
+
+from holdings_csv import read_holdings_csv, split_holdings_file
+
+try:
+    # Arrow-backed strings for sector cleaning; falls back to pandas strings if missing
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 
 # Sector to Industry Mapping with GPR Parameters
@@ -71,92 +79,75 @@ SECTOR_MAPPING = {
 }
 
 
-def find_header_row(file_path: str, header_marker: str = "Ticker") -> Optional[int]:
-    """
-    Find the row containing the actual header by looking for header_marker.
-    
-    Args:
-        file_path: Path to the CSV file
-        header_marker: String to identify the header row
-        
-    Returns:
-        Row number (0-indexed) where header starts, or None if not found
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for i, line in enumerate(f):
-            if header_marker in line:
-                return i
-    return None
+def _industry_id(industry_name: str) -> str:
+    """Lowercase_underscore id for an industry name (e.g. "depository_institutions")."""
+    return industry_name.lower().replace(" ", "_").replace("&", "and")
 
 
-def clean_numeric(value: str) -> Optional[float]:
-    """
-    Clean and convert a numeric string to float.
-    Handles commas and other formatting.
-    
-    Args:
-        value: String value to convert
-        
-    Returns:
-        Float value or None if conversion fails
-    """
-    if pd.isna(value) or value == '-' or value == '':
-        return None
-    
-    try:
-        # Remove commas and quotes
-        cleaned = str(value).replace(',', '').replace('"', '')
-        return float(cleaned)
-    except (ValueError, AttributeError):
-        return None
+CASH_INDUSTRY_NAME = "Cash and/or Derivatives"
+UNKNOWN_INDUSTRY_NAME = "Unknown"
+
+
+# Input columns consumed from the holdings export
+REQUIRED_COLUMNS = ["Ticker", "Name", "Sector", "Weight (%)", "Market Value"]
+NUMERIC_COLUMNS = ["Weight (%)", "Market Value"]
 
+# Sector lookup arrays aligned with the categories of a sector Categorical,
+# so mapping a column is a single integer gather per field. The sector space
+# is fixed, so industry ids are computed here once rather than per row.
+SECTOR_NAMES = list(SECTOR_MAPPING)
+INDUSTRY_NAME_ARR = np.array([SECTOR_MAPPING[s]["fed_industry_name"] for s in SECTOR_NAMES], dtype=object)
+INDUSTRY_ID_ARR = np.array([_industry_id(name) for name in INDUSTRY_NAME_ARR], dtype=object)
+BETA_ARR = np.array([SECTOR_MAPPING[s]["gpr_beta"] for s in SECTOR_NAMES], dtype=np.float64)
+SENT_ARR = np.array([SECTOR_MAPPING[s]["gpr_sentiment"] for s in SECTOR_NAMES], dtype=np.float64)
 
-def map_sector(sector: str) -> Tuple[str, float, float, float]:
+
+def map_sectors(sectors: pd.Series) -> pd.DataFrame:
     """
-    Map a sector to its fed_industry_name and GPR parameters.
+    Map a column of sectors to fed_industry_name and GPR parameters.
     
     Args:
-        sector: Raw sector name
+        sectors: Series of raw sector names
         
     Returns:
-        Tuple of (fed_industry_name, gpr_beta, gpr_sentiment, mapping_confidence)
+        DataFrame aligned to sectors.index with columns
+        (fed_industry_name, fed_industry_id, gpr_beta, gpr_sentiment, mapping_confidence)
     """
-    if pd.isna(sector):
-        return ("Unknown", 0.0, 0.0, 0.0)
-    
-    sector = str(sector).strip()
+    # Arrow-backed strings keep strip/contains in C; missing sectors stay NA
+    string_dtype = "string[pyarrow]" if pa is not None else "string"
+    stripped = sectors.astype(string_dtype).str.strip()
+    codes = pd.Categorical(stripped, categories=SECTOR_NAMES).codes
     
-    # Check if it's Cash/Derivatives (skip or low confidence)
-    if "Cash" in sector or "Derivatives" in sector:
-        return ("Cash and/or Derivatives", 0.0, 0.0, 0.0)
+    # Cash/Derivatives rows are kept but flagged with confidence 0.0
+    is_cash = stripped.str.contains("Cash|Derivatives", regex=True, na=False).to_numpy(dtype=bool)
+    is_missing = stripped.isna().to_numpy(dtype=bool)
+    known = (codes >= 0) & ~is_cash
+    is_unmapped = ~known & ~is_cash & ~is_missing
     
-    # Look up in mapping
-    if sector in SECTOR_MAPPING:
-        mapping = SECTOR_MAPPING[sector]
-        return (
-            mapping["fed_industry_name"],
-            mapping["gpr_beta"],
-            mapping["gpr_sentiment"],
-            1.0,
-        )
+    # Unmapped sectors
+    for sector in stripped[is_unmapped].unique():
+        print(f"WARNING: Unmapped sector: '{sector}'")
     
-    # Unmapped sector
-    print(f"WARNING: Unmapped sector: '{sector}'")
-    return ("Unknown", 0.0, 0.0, 0.0)
-
-
-def industry_name_to_id(industry_name: str) -> str:
-    """
-    Convert industry name to lowercase_underscore ID.
-    
-    Args:
-        industry_name: Industry name (e.g., "Depository Institutions")
-        
-    Returns:
-        Lowercase underscore version (e.g., "depository_institutions")
-    """
-    # Convert to lowercase and replace spaces with underscores
-    return industry_name.lower().replace(" ", "_").replace("&", "and")
+    safe_codes = codes.clip(min=0)
+    conditions = [known, is_cash]
+    return pd.DataFrame(
+        {
+            "fed_industry_name": np.select(
+                conditions,
+                [INDUSTRY_NAME_ARR[safe_codes], CASH_INDUSTRY_NAME],
+                default=UNKNOWN_INDUSTRY_NAME,
+            ).astype(object),
+            "fed_industry_id": np.select(
+                conditions,
+                [INDUSTRY_ID_ARR[safe_codes], _industry_id(CASH_INDUSTRY_NAME)],
+                default=_industry_id(UNKNOWN_INDUSTRY_NAME),
+            ).astype(object),
+            "gpr_beta": np.select(conditions, [BETA_ARR[safe_codes], 0.0], default=0.0),
+            "gpr_sentiment": np.select(conditions, [SENT_ARR[safe_codes], 0.0], default=0.0),
+            "mapping_confidence": np.select(conditions, [1.0, 0.0], default=0.0),
+        },
+        index=sectors.index,
+    )
 
 
 def build_publication_dataset():
@@ -173,80 +164,58 @@ def build_publication_dataset():
         print(f"ERROR: Input file not found: {input_file}")
         return
     
-    # Find header row
-    header_row = find_header_row(str(input_file))
+    # Find header row (single pass over the file)
+    header_row, csv_text = split_holdings_file(input_file)
     if header_row is None:
         print("ERROR: Could not find header row containing 'Ticker'")
         return
     
     print(f"INFO: Header row found at line {header_row + 1}")
     
-    # Read CSV
+    # Read CSV (only the columns we consume)
     try:
-        df = pd.read_csv(input_file, skiprows=header_row)
+        df = read_holdings_csv(csv_text, usecols=REQUIRED_COLUMNS, numeric_cols=NUMERIC_COLUMNS)
         print(f"INFO: Read {len(df)} rows from input file")
     except Exception as e:
         print(f"ERROR: Failed to read CSV: {e}")
         return
     
     # Verify required columns
-    required_cols = ["Ticker", "Name", "Sector", "Weight (%)", "Market Value"]
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing_cols:
         print(f"ERROR: Missing columns: {missing_cols}")
         print(f"Available columns: {list(df.columns)}")
         return
     
-    # Build output dataframe
-    output_rows = []
-    mapped_count = 0
-    unmapped_count = 0
+    # Numeric fields are parsed at read time; skip rows without a sector or
+    # with invalid data
+    valid = df.dropna(subset=["Sector", *NUMERIC_COLUMNS])
     
-    for idx, row in df.iterrows():
-        sector = row["Sector"]
-        
-        # Skip cash/derivatives rows (they will have confidence 0.0)
-        if pd.isna(sector):
-            continue
-        
-        # Map sector
-        fed_industry_name, gpr_beta, gpr_sentiment, confidence = map_sector(sector)
-        
-        # Clean numeric fields
-        weight_pct = clean_numeric(row["Weight (%)"])
-        market_value = clean_numeric(row["Market Value"])
-        
-        if weight_pct is None or market_value is None:
-            # Skip rows with invalid data
-            continue
-        
-        # Create output row
-        output_row = {
+    mapped = map_sectors(valid["Sector"])
+    
+    # Build output dataframe column-wise from aligned arrays; constant
+    # columns are broadcast from scalars
+    output_df = pd.DataFrame(
+        {
             "fund_name": "iShares World ex U.S. Carbon Transition Readiness Aware Active ETF",
             "as_of_date": "2025-12-31",
-            "security_name_report": row["Name"],
-            "ticker_guess": row["Ticker"],
+            "security_name_report": valid["Name"].to_numpy(),
+            "ticker_guess": valid["Ticker"].to_numpy(),
             "isin_guess": "",
-            "sector_raw": sector,
-            "weight_pct": weight_pct,
-            "market_value_raw": market_value,
-            "fed_industry_name": fed_industry_name,
-            "fed_industry_id": industry_name_to_id(fed_industry_name),
-            "gpr_beta": gpr_beta,
-            "gpr_sentiment": gpr_sentiment,
-            "mapping_confidence": confidence,
+            "sector_raw": valid["Sector"].to_numpy(),
+            "weight_pct": valid["Weight (%)"].to_numpy(),
+            "market_value_raw": valid["Market Value"].to_numpy(),
+            "fed_industry_name": mapped["fed_industry_name"].to_numpy(),
+            "fed_industry_id": mapped["fed_industry_id"].to_numpy(),
+            "gpr_beta": mapped["gpr_beta"].to_numpy(),
+            "gpr_sentiment": mapped["gpr_sentiment"].to_numpy(),
+            "mapping_confidence": mapped["mapping_confidence"].to_numpy(),
             "mapping_rationale_short": "Automated sector mapping.",
         }
-        
-        output_rows.append(output_row)
-        
-        if confidence > 0.0:
-            mapped_count += 1
-        else:
-            unmapped_count += 1
+    )
     
-    # Create output dataframe
-    output_df = pd.DataFrame(output_rows)
+    mapped_count = int((output_df["mapping_confidence"] > 0.0).sum())
+    unmapped_count = len(output_df) - mapped_count
     
     if len(output_df) == 0:
         print("ERROR: No valid rows to write")
@@ -0,0 +1,114 @@
+"""
+Shared helpers for reading raw iShares holdings exports (e.g. LCTD_holdings.csv).
+
+The export starts with a fund-level preamble (name, as-of date, shares
+outstanding, ...) before the actual holdings table, whose header row is
+identified by the "Ticker" column.
+"""
+
+import csv
+from io import StringIO
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    # Multithreaded Arrow CSV reader; falls back to the C engine if missing
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Placeholders used in the export for missing numeric values
+NA_VALUES = ["-", ""]
+
+
+def find_header_row(lines: List[str], header_marker: str = "Ticker") -> Optional[int]:
+    """
+    Find the row containing the actual header by looking for header_marker.
+
+    Args:
+        lines: Lines of the CSV file
+        header_marker: String to identify the header row
+
+    Returns:
+        Row number (0-indexed) where header starts, or None if not found
+    """
+    for i, line in enumerate(lines):
+        if header_marker in line:
+            return i
+    return None
+
+
+def split_holdings_file(file_path, header_marker: str = "Ticker") -> Tuple[Optional[int], str]:
+    """
+    Read a holdings export once and split off the preamble.
+
+    Args:
+        file_path: Path to the CSV file
+        header_marker: String to identify the header row
+
+    Returns:
+        Tuple of (header row index, CSV text of the holdings table).
+        The index is None and the text empty if no header row was found.
+    """
+    lines = Path(file_path).read_text(encoding="utf-8").splitlines()
+    header_row = find_header_row(lines, header_marker)
+    if header_row is None:
+        return None, ""
+
+    # The holdings table ends at the first blank line; the legal disclaimer
+    # that follows has a ragged field count the Arrow reader rejects.
+    end = len(lines)
+    for i in range(header_row + 1, len(lines)):
+        if not lines[i].strip():
+            end = i
+            break
+    return header_row, "\n".join(lines[header_row:end])
+
+
+def read_holdings_csv(
+    csv_text: str,
+    usecols: Optional[List[str]] = None,
+    numeric_cols: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Parse the holdings table returned by `split_holdings_file`.
+
+    Uses the pyarrow engine with Arrow-backed dtypes when pyarrow is
+    installed, otherwise the default C engine.
+
+    Args:
+        csv_text: CSV text starting at the header row
+        usecols: Optional columns to parse; other fields are skipped. Columns
+            missing from the header are ignored so callers can report them.
+        numeric_cols: Optional columns to return as floats. Thousands
+            separators are handled by the parser; '-', '' and other invalid
+            entries become NaN.
+
+    Returns:
+        DataFrame of holdings
+    """
+    if usecols is not None:
+        wanted = set(usecols)
+        header = next(csv.reader([csv_text.split("\n", 1)[0]]), [])
+        usecols = [col for col in header if col in wanted]
+
+    if CSV_ENGINE == "pyarrow":
+        df = pd.read_csv(
+            StringIO(csv_text), usecols=usecols, na_values=NA_VALUES, engine="pyarrow", dtype_backend="pyarrow"
+        )
+    else:
+        df = pd.read_csv(StringIO(csv_text), usecols=usecols, na_values=NA_VALUES, thousands=",")
+
+    for col in numeric_cols or []:
+        if col not in df.columns:
+            continue
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            # The Arrow reader has no thousands option; strip separators on
+            # the Arrow-backed strings instead
+            values = values.str.replace(",", "", regex=False)
+        df[col] = pd.to_numeric(values, errors="coerce").astype("float64")
+    return df
@@ -3,6 +3,13 @@ from typing import Optional, Sequence
 
 import pandas as pd
 
+try:
+    # Rust-backed reader; much faster than openpyxl/xlrd on the full GPR sheet
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
 
 def _get_column(
     df: pd.DataFrame,
@@ -70,7 +77,8 @@ def convert(
     # getting a dict of DataFrames from pandas.
     effective_sheet = 0 if sheet_name is None else sheet_name
 
-    df = pd.read_excel(input_path, sheet_name=effective_sheet)
+    # Use calamine when installed, otherwise let pandas pick its default engine.
+    df = pd.read_excel(input_path, sheet_name=effective_sheet, engine=EXCEL_ENGINE)
 
     # Normalise column names to UPPERCASE and strip whitespace
     df.columns = [str(c).strip().upper() for c in df.columns]
@@ -82,20 +90,24 @@ def convert(
         df, ["DATE", "DAY"], required=True, name_for_error="DATE/DAY"
     )
 
-    # Try to parse DAY as YYYYMMDD; if that fails, let pandas guess
-    # (this covers both integer and string encodings).
-    day_as_str = day_series.astype(str)
-    # Heuristic: if most entries have length 8, assume YYYYMMDD
-    if (day_as_str.str.len() == 8).mean() > 0.8:
-        date_parsed = pd.to_datetime(day_as_str, format="%Y%m%d", errors="coerce")
+    # Try to parse DAY as YYYYMMDD; if that fails, let pandas guess.
+    # Integer encodings (the usual case) are parsed directly without a
+    # string round-trip.
+    if pd.api.types.is_integer_dtype(day_series):
+        date_parsed = pd.to_datetime(day_series, format="%Y%m%d", errors="coerce")
     else:
-        date_parsed = pd.to_datetime(day_series, errors="coerce")
+        day_as_str = day_series.astype(str)
+        # Heuristic: if most entries have length 8, assume YYYYMMDD
+        if (day_as_str.str.len() == 8).mean() > 0.8:
+            date_parsed = pd.to_datetime(day_as_str, format="%Y%m%d", errors="coerce")
+        else:
+            date_parsed = pd.to_datetime(day_series, errors="coerce")
 
     if date_parsed.isna().all():
         raise ValueError("Could not parse dates from DATE/DAY column.")
 
-    # Normalise to date (no time)
-    date_col = date_parsed.dt.date
+    # Normalise to midnight but keep datetime64; the CSV writer emits ISO dates
+    date_col = date_parsed.dt.normalize()
 
     # GPRD: required
     gprd = _get_column(df, ["GPRD"], required=True, name_for_error="GPRD")
@@ -151,7 +163,7 @@ def convert(
 
     # Save to CSV (no index)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    cleaned.to_csv(output_path, index=False)
+    cleaned.to_csv(output_path, index=False, date_format="%Y-%m-%d")
     
     # Return number of rows written (excluding header)
     return len(cleaned)
@@ -11,11 +11,16 @@ This script is intentionally minimal and uses hard-coded demo paths.
 #   --output-holdings out/demo_report_worldexch_2025-06-23_holdings.json
 from __future__ import annotations
 
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 import json
 import logging
 
-from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_from_csv
+import numpy as np
+
+from gpr_overlay.cli.json_output import dumps_json_bytes, write_json
+from gpr_overlay.services.gpr_ingestion_service import gpr_series_from_df, load_gpr_daily_df
 import argparse
 from datetime import datetime
 
@@ -30,6 +35,7 @@ from gpr_overlay.services.gpr_event_detection_service import (
 from gpr_overlay.data_models.gpr_event import GprEvent, GprEventType
 from gpr_overlay.services.portfolio_overlay_service import (
     load_portfolio_snapshot_from_csv,
+    compute_industry_shortlists,
     compute_portfolio_industry_exposure,
 )
 from gpr_overlay.services.industry_impact_service import compute_event_portfolio_impact
@@ -73,8 +79,10 @@ def main():
     default_fund_csv = data_root / "raw_portfolio_template.csv"
     fund_csv = Path(args.portfolio_file) if args.portfolio_file else default_fund_csv
 
-    points = load_gpr_daily_from_csv(gpr_csv)
-    events = detect_gpr_events(points)
+    # Parse the GPR CSV once (reusing its Feather sidecar across runs); detection
+    # reads its columns directly, without per-day points
+    gpr_df = load_gpr_daily_df(gpr_csv, use_feather_cache=True)
+    events = detect_gpr_events(gpr_series_from_df(gpr_df))
 
     chosen_event = None
     # Manual override: if all three manual args are provided, construct a manual event
@@ -87,24 +95,30 @@ def main():
             logger.error("Could not parse manual event dates. Use YYYY-MM-DD for all manual dates.")
             return
 
-        # Build a pandas series from points to compute percentile
-        import pandas as _pd
-
-        df_pts = _pd.DataFrame([{"date": p.date, "gprd": float(p.gprd)} for p in points])
-        df_pts = df_pts.sort_values("date").reset_index(drop=True)
-        row = df_pts[df_pts["date"] == peak_date]
-        if row.empty:
+        # Take date/value arrays straight from the GPR frame and sort once to locate the
+        # peak and compute percentile
+        dates = gpr_df["DATE"].to_numpy(dtype="datetime64[D]")
+        gprd = gpr_df["GPRD"].to_numpy(dtype=np.float64)
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+        gprd = gprd[order]
+
+        peak = np.datetime64(peak_date, "D")
+        idx = int(np.searchsorted(dates, peak))
+        if idx >= dates.size or dates[idx] != peak:
             logger.error("No GPR value found for manual peak date %s", peak_date.isoformat())
             return
 
-        val = float(row.iloc[0]["gprd"]) if not _pd.isna(row.iloc[0]["gprd"]) else None
+        val = float(gprd[idx]) if not np.isnan(gprd[idx]) else None
         if val is None:
             logger.error("GPR value at manual peak date is missing: %s", peak_date.isoformat())
             return
 
-        # percentile fraction 0..1
-        full = df_pts["gprd"].dropna().values
-        pct = float((full <= val).sum()) / float(full.size) if full.size > 0 else 0.0
+        # percentile fraction 0..1: rank of val in the sorted history (no boolean mask)
+        sorted_full = np.sort(gprd[~np.isnan(gprd)])
+        n_full = sorted_full.size
+        pct = float(np.searchsorted(sorted_full, val, side="right")) / float(n_full) if n_full > 0 else 0.0
+        baseline = float(np.median(sorted_full)) if n_full > 0 else None
 
         if pct >= EXTREME_SPIKE_Q:
             ev_type = GprEventType.EXTREME_SPIKE
@@ -124,7 +138,7 @@ def main():
             end_date=end_date,
             peak_date=peak_date,
             gpr_level_at_peak=val,
-            gpr_delta_from_baseline=float(val - float(_pd.Series(full).median())) if full.size > 0 else 0.0,
+            gpr_delta_from_baseline=float(val - baseline) if baseline is not None else 0.0,
             severity_score=float(pct),
             percentile=float(pct),
             label=label,
@@ -161,28 +175,27 @@ def main():
     impact_profile = compute_event_portfolio_impact(chosen_event, exposures)
     report = build_advisory_report(snapshot, impact_profile)
 
-    # Pydantic v2: use model_dump_json for stable JSON serialization
-    report_json = report.model_dump_json(indent=2)
+    # Pydantic v2: dump to JSON-ready python objects once, then encode
+    report_bytes = dumps_json_bytes(report.model_dump(mode="json"))
     if args.output_report:
-        Path(args.output_report).write_text(report_json, encoding="utf-8")
+        Path(args.output_report).write_bytes(report_bytes)
         logger.info("Wrote advisory report to %s", args.output_report)
     else:
-        print(report_json)
+        print(report_bytes.decode("utf-8"))
 
     # Optionally produce holdings shortlists and criteria_matches for Langflow
     if args.output_holdings:
-        # Build holdings list used for shortlists and matches (include only allowed fields)
-        holdings_list = []
-        for h in snapshot.holdings:
-            holdings_list.append(
-                {
-                    "security_name_report": h.security_name_report,
-                    "weight_pct": h.weight_pct,
-                    "fed_industry_name": h.fed_industry_name,
-                    "region_guess": getattr(h, "region_guess", None),
-                    "country_guess": getattr(h, "country_guess", None),
-                }
-            )
+        holdings = snapshot.holdings
+
+        def _holding_record(h):
+            # Only allowed fields are exported
+            return {
+                "security_name_report": h.security_name_report,
+                "weight_pct": h.weight_pct,
+                "fed_industry_name": h.fed_industry_name,
+                "region_guess": h.region_guess,
+                "country_guess": h.country_guess,
+            }
 
         # Determine industries to include based on holdings_mode using impact_profile
         sel_industry_names = set()
@@ -191,37 +204,21 @@ def main():
         elif args.holdings_mode == "resilient":
             sel_industry_names = {it.fed_industry_name for it in impact_profile.resilient_industries}
         else:
-            sel_industry_names = {it.fed_industry_name for it in (impact_profile.vulnerable_industries + impact_profile.resilient_industries)}
-
-        # Group holdings by fed_industry_name and build top-N lists
-        from collections import defaultdict
-        by_ind = defaultdict(list)
-        for item in holdings_list:
-            name = item.get("fed_industry_name") or "__unknown__"
-            if name in sel_industry_names:
-                # Only include holdings whose industry is in the selected set
-                by_ind[name].append(item)
-
-        shortlists_by_industry = {}
-        for ind_name, items in by_ind.items():
-            # Sort by weight_pct descending, treat None as -inf so they go last
-            def _weight_key(x):
-                try:
-                    return float(x.get("weight_pct") or 0.0)
-                except Exception:
-                    return 0.0
-
-            items_sorted = sorted(items, key=_weight_key, reverse=True)
-            shortlists_by_industry[ind_name] = items_sorted[: args.per_industry]
+            sel_industry_names = {it.fed_industry_name for it in chain(impact_profile.vulnerable_industries, impact_profile.resilient_industries)}
+
+        # Top-N holdings per selected industry by weight_pct descending
+        shortlist_holdings = compute_industry_shortlists(snapshot, sel_industry_names, args.per_industry)
+        shortlists_by_industry = {
+            ind_name: [_holding_record(h) for h in items] for ind_name, items in shortlist_holdings.items()
+        }
 
         # Criteria matching: parse criteria JSON if provided and generate deterministic matches
-        import json as _json
         criteria_matches_list = []
 
         if args.criteria_json:
             raw = None
             try:
-                raw = _json.loads(Path(args.criteria_json).read_text(encoding="utf-8"))
+                raw = json.loads(Path(args.criteria_json).read_text(encoding="utf-8"))
             except Exception:
                 logger.exception("Could not read/parse criteria JSON %s", args.criteria_json)
                 raw = None
@@ -249,22 +246,26 @@ def main():
                             if cid and region and ind:
                                 parsed_criteria.append({"cluster_id": cid, "region_guess": region, "industry_name": ind})
 
-            # For each parsed criteria item, perform deterministic case-insensitive exact matching after strip
-            for crit in parsed_criteria:
-                matches = []
-                for h in holdings_list:
-                    h_region = (h.get("region_guess") or "").strip()
-                    h_ind = (h.get("fed_industry_name") or "").strip()
-                    if h_region.lower() == str(crit.get("region_guess") or "").strip().lower() and h_ind.lower() == str(crit.get("industry_name") or "").strip().lower():
-                        matches.append(
-                            {
-                                "security_name_report": h.get("security_name_report"),
-                                "weight_pct": h.get("weight_pct"),
-                                "fed_industry_name": h.get("fed_industry_name"),
-                                "region_guess": h.get("region_guess"),
-                                "country_guess": h.get("country_guess"),
-                            }
-                        )
+            # Index holdings once by normalized (region, industry) so each criterion is a single
+            # dict lookup; matching stays deterministic, case-insensitive and exact after strip
+            crit_keys = [
+                (
+                    str(crit.get("region_guess") or "").strip().lower(),
+                    str(crit.get("industry_name") or "").strip().lower(),
+                )
+                for crit in parsed_criteria
+            ]
+            # Output records are only materialized for holdings some criterion asks for
+            wanted_keys = set(crit_keys)
+            match_index = defaultdict(list)
+            if wanted_keys:
+                for h in holdings:
+                    key = ((h.region_guess or "").strip().lower(), (h.fed_industry_name or "").strip().lower())
+                    if key in wanted_keys:
+                        match_index[key].append(_holding_record(h))
+
+            for crit, key in zip(parsed_criteria, crit_keys):
+                matches = match_index.get(key, [])
                 criteria_matches_list.append(
                     {
                         "cluster_id": crit.get("cluster_id"),
@@ -274,10 +275,12 @@ def main():
                     }
                 )
 
-        # Build per-industry summaries from impact_profile
+        # Build per-industry summaries and the name lookup from impact_profile in one pass
         industry_summaries = {}
-        ind_by_name = {it.fed_industry_name: it for it in impact_profile.industries}
-        for name, it in ind_by_name.items():
+        ind_by_name = {}
+        for it in impact_profile.industries:
+            name = it.fed_industry_name
+            ind_by_name[name] = it
             industry_summaries[name] = {
                 "industry_portfolio_weight": it.portfolio_weight,
                 "industry_weight_share_of_portfolio": it.industry_weight_share_of_portfolio,
@@ -285,28 +288,24 @@ def main():
             }
 
         # enrich shortlists with holding-level industry weight share (holding.weight / industry_portfolio_weight)
+        # Industry weights are looked up once per industry, not per holding.
+        pw_by_ind = {
+            name: (ind_by_name[name].portfolio_weight if name in ind_by_name else 0.0)
+            for name in shortlists_by_industry
+        }
         for ind_name, items in shortlists_by_industry.items():
-            ind_pw = ind_by_name.get(ind_name).portfolio_weight if ind_by_name.get(ind_name) is not None else 0.0
-            for h in items:
-                try:
-                    hw = float(h.get("weight_pct") or 0.0)
-                except Exception:
-                    hw = 0.0
-                h["industry_weight_share_for_holding"] = float(hw / ind_pw) if ind_pw > 0 else 0.0
-
-        # Use a stable dict for event metadata: include full event object consistent with advisory report
-        ev_obj = impact_profile.event.model_dump()
-        # Ensure enum serialized to its value
-        if isinstance(ev_obj.get("event_type"), dict):
-            ev_obj["event_type"] = ev_obj["event_type"].get("value")
-        elif hasattr(impact_profile.event.event_type, "value"):
-            ev_obj["event_type"] = impact_profile.event.event_type.value
+            ind_pw = pw_by_ind[ind_name]
+            for rec, h in zip(items, shortlist_holdings[ind_name]):
+                rec["industry_weight_share_for_holding"] = (h.weight_pct or 0.0) / ind_pw if ind_pw > 0 else 0.0
 
         holdings_output = {
             "meta": {
                 "fund_name": snapshot.fund_name,
-                "as_of_date": snapshot.as_of_date.isoformat(),
-                "event": ev_obj,
+                # date is encoded as ISO-8601 by either JSON encoder
+                "as_of_date": snapshot.as_of_date,
+                # Full event object consistent with the advisory report; the encoder dumps it
+                # once in JSON mode (enum value, ISO dates)
+                "event": impact_profile.event,
             },
             "vulnerability_composition": impact_profile.vulnerability_composition,
             "industry_summaries": industry_summaries,
@@ -316,7 +315,7 @@ def main():
             "criteria_matches": criteria_matches_list,
         }
 
-        Path(args.output_holdings).write_text(_json.dumps(holdings_output, indent=2, default=str), encoding="utf-8")
+        write_json(holdings_output, args.output_holdings)
         logger.info("Wrote holdings shortlists to %s", args.output_holdings)
 
 
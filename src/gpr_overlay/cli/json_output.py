@@ -0,0 +1,49 @@
+"""JSON encoding shared by the CLI entrypoints.
+
+Outputs are indented UTF-8 JSON. orjson is used when installed; the stdlib
+fallback is configured to produce the same text (non-ASCII characters kept
+as-is, dates in ISO-8601, NumPy values as plain numbers and lists).
+"""
+from __future__ import annotations
+
+from datetime import date, time
+from pathlib import Path
+import json
+
+import numpy as np
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Fallback encoder: pydantic models are dumped once in JSON mode, anything else via str()."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    # Only reached by the stdlib encoder; orjson handles these natively
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def dumps_json_bytes(obj) -> bytes:
+    """Encode obj as indented UTF-8 JSON; uses orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def write_json(obj, path: Path | str) -> None:
+    """Write obj to path as indented JSON in a single bytes write."""
+    Path(path).write_bytes(dumps_json_bytes(obj))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from gpr_overlay.data_models.gpr_event import GprEvent
 from gpr_overlay.data_models.industry_impact import EventImpactProfile
@@ -26,6 +26,8 @@ class AdvisoryAction(BaseModel):
 
 
 class AdvisoryReport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     fund_name: str
     as_of_date: date
 
@@ -4,7 +4,7 @@ from datetime import date
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class GprEventType(str, Enum):
@@ -32,6 +32,8 @@ class GprEvent(BaseModel):
     and usable as triggers for downstream analysis and advisory.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     event_id: str
     event_type: GprEventType
 
@@ -6,9 +6,11 @@ This corresponds to a single row in `data/raw/gpr_daily_original/gpr_daily_recen
 """
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import date
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
 
 
 class GprDailyPoint(BaseModel):
@@ -18,6 +20,8 @@ class GprDailyPoint(BaseModel):
     the Python model; loader functions will map CSV column names to these fields.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     date: date
     n10d: Optional[float]
     gprd: float
@@ -26,3 +30,38 @@ class GprDailyPoint(BaseModel):
     gprd_ma30: Optional[float] = None
     gprd_ma7: Optional[float] = None
     event: Optional[str] = None
+
+
+class GprDailySeries(BaseModel):
+    """Column-wise (struct-of-arrays) form of a daily GPR series.
+
+    Holds only the columns event detection reads, as parallel NumPy arrays:
+    `dates` (datetime64[D]), `gprd` and the optional moving averages
+    (float64, NaN where missing). Accepted by `detect_gpr_events` in place of
+    a list of `GprDailyPoint`.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    dates: np.ndarray
+    gprd: np.ndarray
+    gprd_ma7: np.ndarray
+    gprd_ma30: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @classmethod
+    def from_points(cls, points: List[GprDailyPoint]) -> "GprDailySeries":
+        """Build the arrays from a list of points in a single pass (None -> NaN)."""
+        n = len(points)
+        dates = np.empty(n, dtype="datetime64[D]")
+        gprd = np.empty(n, dtype=np.float64)
+        ma7 = np.empty(n, dtype=np.float64)
+        ma30 = np.empty(n, dtype=np.float64)
+        for i, p in enumerate(points):
+            dates[i] = p.date
+            gprd[i] = p.gprd
+            ma7[i] = p.gprd_ma7 if p.gprd_ma7 is not None else np.nan
+            ma30[i] = p.gprd_ma30 if p.gprd_ma30 is not None else np.nan
+        return cls.model_construct(dates=dates, gprd=gprd, gprd_ma7=ma7, gprd_ma30=ma30)
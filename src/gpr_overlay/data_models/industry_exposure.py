@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class IndustryExposure(BaseModel):
@@ -11,6 +11,9 @@ class IndustryExposure(BaseModel):
     all holdings mapped to a single Fed industry identifier.
     """
 
+    # Not frozen: contribution_to_vulnerability is filled in after construction
+    model_config = ConfigDict(extra="forbid")
+
     fed_industry_id: str
     fed_industry_name: str
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from gpr_overlay.data_models.gpr_event import GprEvent
 from gpr_overlay.data_models.industry_exposure import IndustryExposure
@@ -15,6 +15,8 @@ class EventIndustryImpact(BaseModel):
     and a simple impact score.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     fed_industry_id: str
     fed_industry_name: str
 
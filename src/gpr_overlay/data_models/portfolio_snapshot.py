@@ -6,9 +6,12 @@ extracted from BLKB reports and mapping to Fed industry identifiers.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class PortfolioHolding(BaseModel):
@@ -18,6 +21,8 @@ class PortfolioHolding(BaseModel):
     report and the Fed GPR industries.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     security_name_report: str
     ticker_guess: Optional[str] = None
     isin_guess: Optional[str] = None
@@ -49,3 +54,30 @@ class PortfolioSnapshot(BaseModel):
     fund_name: str
     as_of_date: date
     holdings: List[PortfolioHolding] = Field(default_factory=list)
+
+    # (holdings the frame was built from, frame); see `holdings_df`
+    _holdings_df_cache: Optional[Tuple[tuple, "pd.DataFrame"]] = PrivateAttr(default=None)
+
+    @property
+    def holdings_df(self) -> "pd.DataFrame":
+        """Holdings as a DataFrame with one column per `PortfolioHolding` field.
+
+        Built on first access (one `model_dump` per holding) and cached on the
+        snapshot, so repeated column-wise consumers share a single copy. The
+        cache is keyed on the current holdings, so appending to, reassigning or
+        `model_copy`-updating `holdings` rebuilds the frame.
+        """
+        import pandas as pd
+
+        key = tuple(self.holdings)
+        cached = self._holdings_df_cache
+        # Tuple equality short-circuits on identity, so an unchanged snapshot
+        # costs one pointer comparison per holding
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        df = pd.DataFrame.from_records(
+            [h.model_dump() for h in key],
+            columns=list(PortfolioHolding.model_fields),
+        )
+        self._holdings_df_cache = (key, df)
+        return df
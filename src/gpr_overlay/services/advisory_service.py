@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import List
 from datetime import date
 
@@ -6,6 +7,7 @@ from gpr_overlay.data_models.advisory_report import (
     AdvisoryAction,
     AdvisoryActionType,
 )
+from gpr_overlay.data_models.gpr_event import GprEventType
 from gpr_overlay.data_models.industry_impact import EventImpactProfile, EventIndustryImpact
 from gpr_overlay.data_models.portfolio_snapshot import PortfolioSnapshot
 
@@ -13,13 +15,17 @@ from gpr_overlay.data_models.portfolio_snapshot import PortfolioSnapshot
 # Simple ESG constraint placeholder: industries we do not recommend tilting UP into.
 # Use canonical lower-case industry ids for comparisons; keeps the check robust to
 # presentation name differences (we'll check both fed_industry_id and fed_industry_name).
-ESG_BANNED_INDUSTRY_IDS = {
+# Built once at import as an immutable set for O(1) membership checks.
+ESG_BANNED_INDUSTRY_IDS = frozenset({
     "coal",
     "petroleum_and_natural_gas",
     "oil_and_gas",
     "defense",
     "weapons",
-}
+})
+
+# Display label per event type ("short_term_spike" -> "short term spike"), built once
+_EVENT_TYPE_LABELS = MappingProxyType({t: t.value.replace("_", " ") for t in GprEventType})
 
 
 def _top_industry_names(items: List[EventIndustryImpact], n: int = 5) -> List[str]:
@@ -60,6 +66,11 @@ def build_advisory_report(snapshot: PortfolioSnapshot, impact_profile: EventImpa
     # Normalise event severity for display/use: if None, treat as 1.0 (worst-case)
     severity = float(event.severity_score) if event.severity_score is not None else 1.0
 
+    # Event strings shared by the summary and key points, formatted once
+    event_type_str = _EVENT_TYPE_LABELS[event.event_type]
+    sev_str = f"{severity:.2f}"
+    peak_str = str(event.peak_date)
+
     # logical interpretation of net impact
     is_net_resilient = net > 0.0
 
@@ -70,14 +81,14 @@ def build_advisory_report(snapshot: PortfolioSnapshot, impact_profile: EventImpa
     # If there are no mapped industries, produce a short advisory and a monitor action.
     if not impact_profile.industries:
         summary = (
-            f"On {event.peak_date}, the GPR index experienced a "
-            f"{event.event_type.value.replace('_', ' ')} with severity {severity:.2f}. "
+            f"On {peak_str}, the GPR index experienced a "
+            f"{event_type_str} with severity {sev_str}. "
             "No portfolio holdings could be mapped to Fed industries for impact analysis; "
             "generate a full industry mapping to enable per-industry suggestions."
         )
 
         key_points = [
-            f"Detected event type: {event.event_type.value.replace('_', ' ')} on {event.peak_date}.",
+            f"Detected event type: {event_type_str} on {peak_str}.",
             "No mapped holdings: the portfolio snapshot contains no holdings with a Fed industry mapping or betas.",
             "Action: monitor geopolitical developments until mapping or exposures are available.",
         ]
@@ -110,22 +121,22 @@ def build_advisory_report(snapshot: PortfolioSnapshot, impact_profile: EventImpa
     # Normal case: there are per-industry impacts
     if is_net_resilient:
         summary = (
-            f"On {event.peak_date}, the GPR index experienced a "
-            f"{event.event_type.value.replace('_', ' ')} with severity {severity:.2f}. "
+            f"On {peak_str}, the GPR index experienced a "
+            f"{event_type_str} with severity {sev_str}. "
             "The portfolio shows a net POSITIVE GPR impact (net resilient) relative to its baseline vulnerability."
         )
     else:
         summary = (
-            f"On {event.peak_date}, the GPR index experienced a "
-            f"{event.event_type.value.replace('_', ' ')} with severity {severity:.2f}. "
+            f"On {peak_str}, the GPR index experienced a "
+            f"{event_type_str} with severity {sev_str}. "
             "The portfolio shows a net NEGATIVE GPR impact (net vulnerable) relative to its baseline vulnerability."
         )
 
     key_points = [
-        f"Detected event type: {event.event_type.value.replace('_', ' ')} on {event.peak_date} with percentile {event.percentile*100:.1f}%.",
+        f"Detected event type: {event_type_str} on {peak_str} with percentile {event.percentile*100:.1f}%.",
         # Clarify meaning of baseline for readers: it's the portfolio exposure scaled to severity=1.0
         f"Portfolio vulnerability baseline (impact at severity=1.0): {baseline:.4f}.",
-        f"Net event impact at severity {severity:.2f}: {net:.4f}.",
+        f"Net event impact at severity {sev_str}: {net:.4f}.",
         ("Net positive impact: portfolio tends to benefit under this event." if is_net_resilient
          else "Net negative impact: portfolio is tilted towards GPR-sensitive industries and is more exposed during this event."),
         f"Top vulnerable industries in the portfolio: {', '.join(top_vul) if top_vul else 'none' }.",
@@ -1,11 +1,16 @@
-from typing import List, Optional
-from datetime import date
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Optional, Sequence, Tuple, Union
+from datetime import date, timedelta
+import bisect
 import logging
+import os
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
-from gpr_overlay.data_models.gpr_series import GprDailyPoint
+from gpr_overlay.data_models.gpr_series import GprDailyPoint, GprDailySeries
 from gpr_overlay.data_models.gpr_event import GprEvent, GprEventType
 
 logger = logging.getLogger(__name__)
@@ -25,35 +30,114 @@ EXTREME_SPIKE_Q = 0.995
 BUFFER_PRE_DAYS_DEFAULT = 7
 BUFFER_POST_DAYS_DEFAULT = 2
 
+# Default smallest batch worth sending to a pool in detect_gpr_events_batch
+PARALLEL_BATCH_MIN_SERIES = 8
+# Distinct (series, include_regimes) results memoized by detect_gpr_events
+DETECT_CACHE_SIZE = 64
 
-def detect_gpr_events(points: List[GprDailyPoint], include_regimes: bool = False) -> List[GprEvent]:
+
+def detect_gpr_events(
+    points: Union[List[GprDailyPoint], GprDailySeries],
+    include_regimes: bool = False,
+    use_cache: bool = False,
+) -> List[GprEvent]:
     """
     Detect short-term spikes in a sequence of GprDailyPoint.
 
     Args:
-        points: List of GprDailyPoint observations.
+        points: List of GprDailyPoint observations, or the same series in
+            column-wise form as a GprDailySeries.
         include_regimes: If True, also detect episodes and regimes. Default False (spike-only).
+        use_cache: Reuse the result of an earlier call on an identical series
+            (same dates and values, compared byte for byte) under the same
+            module thresholds. Only worth it for callers that repeat the same
+            series; each call returns a new list and the events themselves are
+            immutable.
 
     The algorithm is deliberately simple and explainable. By default, this returns
     ONLY spikes for clean, actionable event detection (suitable for publication).
     """
-    if not points:
+    if len(points) == 0:
         return []
 
-    df = _points_to_dataframe(points)
+    series = points if isinstance(points, GprDailySeries) else GprDailySeries.from_points(points)
+    if use_cache:
+        hits = _detect_cached.cache_info().hits
+        events = list(_detect_cached(_series_key(series), include_regimes, _detection_params()))
+        if _detect_cached.cache_info().hits > hits:
+            logger.info("Detected %d GPR events (cached)", len(events))
+        return events
+    return _detect_series(series, include_regimes)
+
+
+def _detection_params() -> Tuple:
+    """Current module thresholds and windows, so retuning them misses `_detect_cached`."""
+    return (
+        Z_THRESHOLD,
+        LOCAL_MAX_WINDOW,
+        MIN_EPISODE_DAYS,
+        EPISODE_PERCENTILE,
+        MIN_REGIME_DAYS,
+        REGIME_PERCENTILE,
+        ELEVATED_SPIKE_Q,
+        EXTREME_SPIKE_Q,
+        BUFFER_PRE_DAYS_DEFAULT,
+        BUFFER_POST_DAYS_DEFAULT,
+    )
+
+
+def _series_key(series: GprDailySeries) -> bytes:
+    """Raw bytes of the series columns (dates and floats as 64-bit words), for `_detect_cached`."""
+    return np.stack(
+        [
+            series.dates.astype("datetime64[D]").view(np.int64),
+            np.ascontiguousarray(series.gprd, dtype=np.float64).view(np.int64),
+            np.ascontiguousarray(series.gprd_ma7, dtype=np.float64).view(np.int64),
+            np.ascontiguousarray(series.gprd_ma30, dtype=np.float64).view(np.int64),
+        ]
+    ).tobytes()
+
+
+@lru_cache(maxsize=DETECT_CACHE_SIZE)
+def _detect_cached(key: bytes, include_regimes: bool, params: Tuple) -> Tuple[GprEvent, ...]:
+    """Memoized `_detect_series` on the series rebuilt from its `_series_key` bytes.
+
+    `params` (from `_detection_params`) only takes part in the cache key; the
+    detectors read the module thresholds directly.
+    """
+    words = np.frombuffer(key, dtype=np.int64).reshape(4, -1)
+    series = GprDailySeries.model_construct(
+        dates=words[0].view("datetime64[D]"),
+        gprd=words[1].view(np.float64),
+        gprd_ma7=words[2].view(np.float64),
+        gprd_ma30=words[3].view(np.float64),
+    )
+    return tuple(_detect_series(series, include_regimes))
+
+
+def _detect_series(series: GprDailySeries, include_regimes: bool) -> List[GprEvent]:
+    """Run the detectors on a non-empty series (see `detect_gpr_events`)."""
+    df = _series_to_dataframe(series)
+    # Sorted histories for percentile lookups, built once and shared by the detectors
+    sorted_gprd = _sorted_finite(df["gprd"])
 
     # Primary production detector: quantile-based per-day spikes
-    quantile_spikes = _detect_quantile_spikes(df, buffer_pre_days=BUFFER_PRE_DAYS_DEFAULT, buffer_post_days=BUFFER_POST_DAYS_DEFAULT)
+    quantile_spikes = _detect_quantile_spikes(
+        df,
+        buffer_pre_days=BUFFER_PRE_DAYS_DEFAULT,
+        buffer_post_days=BUFFER_POST_DAYS_DEFAULT,
+        sorted_gprd=sorted_gprd,
+    )
 
     # Spike detection (always run)
-    short_term_events = _detect_short_term_spikes(df)
+    short_term_events = _detect_short_term_spikes(df, sorted_gprd=sorted_gprd)
 
     # Only detect episodes and regimes if explicitly requested
     episode_events = []
     regime_events = []
     if include_regimes:
-        episode_events = _detect_episodes(df)
-        regime_events = _detect_regimes(df)
+        episode_events = _detect_episodes(df, sorted_ma7=_sorted_finite(df["gprd_ma7"]))
+        regime_events = _detect_regimes(df, sorted_ma30=_sorted_finite(df["gprd_ma30"]))
 
     # Combine: quantile spikes first, then short-term spikes, then optional episodes/regimes
     events = quantile_spikes + short_term_events + episode_events + regime_events
@@ -69,6 +153,41 @@ def detect_gpr_events(points: List[GprDailyPoint], include_regimes: bool = False
     return events
 
 
+def detect_gpr_events_batch(
+    series_list: Sequence[List[GprDailyPoint]],
+    include_regimes: bool = False,
+    n_workers: Optional[int] = None,
+    min_parallel: int = PARALLEL_BATCH_MIN_SERIES,
+    executor: Optional[Executor] = None,
+) -> List[List[GprEvent]]:
+    """
+    Run `detect_gpr_events` over many independent GPR series (scenarios, bootstraps).
+
+    Args:
+        series_list: One list of GprDailyPoint per series.
+        include_regimes: Passed through to `detect_gpr_events`.
+        n_workers: Worker processes for the default pool; defaults to os.cpu_count().
+        min_parallel: Smallest batch sent to a pool; smaller batches run
+            in-process, since pickling the points costs more than detecting a
+            handful of series.
+        executor: Pool to map over instead of a new ProcessPoolExecutor
+            (n_workers is then ignored). It is not shut down here.
+
+    Returns one event list per series, in input order.
+    """
+    detect = partial(detect_gpr_events, include_regimes=include_regimes)
+    if len(series_list) < min_parallel:
+        return [detect(points) for points in series_list]
+    if executor is not None:
+        return list(executor.map(detect, series_list))
+
+    workers = n_workers or os.cpu_count() or 1
+    if workers <= 1:
+        return [detect(points) for points in series_list]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(detect, series_list))
+
+
 def select_event_for_target_date(events: List[GprEvent], target_date: date) -> Optional[GprEvent]:
     """Select the GprEvent most relevant to the given target_date.
 
@@ -110,6 +229,16 @@ def select_event_for_target_date(events: List[GprEvent], target_date: date) -> O
         return contained[0]
 
     # Otherwise find event with minimal absolute distance to target_date by peak_date
+    # (ties go to the earlier peak, then to the first such event in the list)
+    peak_dates = [e.peak_date for e in working_events]
+    if all(a <= b for a, b in zip(peak_dates, peak_dates[1:])):
+        # detect_gpr_events returns events ordered by peak_date: only the two
+        # neighbours of target_date can be nearest
+        idx = bisect.bisect_left(peak_dates, target_date)
+        candidates = peak_dates[max(idx - 1, 0):idx + 1]
+        nearest = min(candidates, key=lambda d: (abs((d - target_date).days), d))
+        return working_events[bisect.bisect_left(peak_dates, nearest)]
+
     def abs_days(e: GprEvent) -> int:
         return abs((e.peak_date - target_date).days)
 
@@ -117,27 +246,23 @@ def select_event_for_target_date(events: List[GprEvent], target_date: date) -> O
     return working_events_sorted[0]
 
 
-def _points_to_dataframe(points: List[GprDailyPoint]) -> pd.DataFrame:
+def _series_to_dataframe(series: GprDailySeries) -> pd.DataFrame:
     """
-    Convert list of GprDailyPoint into a pandas DataFrame with
+    Convert a GprDailySeries into a pandas DataFrame sorted by date with
     columns: date, gprd, gprd_ma7, gprd_ma30.
 
     If gprd_ma7 or gprd_ma30 are missing in the data, compute them using
     rolling means on gprd (window 7 and 30 respectively).
     """
-    records = []
-    for p in points:
-        records.append({
-            "date": pd.to_datetime(p.date),
-            "gprd": float(p.gprd),
-            "gprd_ma7": float(p.gprd_ma7) if p.gprd_ma7 is not None else np.nan,
-            "gprd_ma30": float(p.gprd_ma30) if p.gprd_ma30 is not None else np.nan,
-        })
-
-    df = pd.DataFrame.from_records(records).sort_values("date").reset_index(drop=True)
-
-    # Ensure datetime
-    df["date"] = pd.to_datetime(df["date"])
+    df = pd.DataFrame(
+        {
+            "date": series.dates.astype("datetime64[ns]"),
+            "gprd": series.gprd,
+            "gprd_ma7": series.gprd_ma7,
+            "gprd_ma30": series.gprd_ma30,
+        }
+    )
+    df = df.sort_values("date").reset_index(drop=True)
 
     # Compute moving averages if missing
     if df["gprd_ma7"].isna().any():
@@ -149,17 +274,108 @@ def _points_to_dataframe(points: List[GprDailyPoint]) -> pd.DataFrame:
     return df
 
 
-def _percentile_of(value: float, series: pd.Series) -> float:
-    """Return simple percentile (0.0-1.0) of value within series (including equals)."""
-    arr = series.dropna().values
-    if arr.size == 0:
-        return 0.0
-    # fraction of values <= value
-    frac = float((arr <= value).sum()) / float(arr.size)
-    return frac
+def _sorted_finite(values: pd.Series) -> np.ndarray:
+    """Return the non-NaN values of a series as a sorted float array (for `_percentile_of`)."""
+    arr = values.to_numpy(dtype=np.float64)
+    return np.sort(arr[~np.isnan(arr)])
+
+
+def _percentile_of(value, sorted_arr: np.ndarray):
+    """Return simple percentile (0.0-1.0) of value within sorted_arr (including equals).
+
+    `sorted_arr` must be sorted and NaN-free (see `_sorted_finite`); value may be a
+    scalar or an array, in which case an array of percentiles is returned.
+    """
+    if sorted_arr.size == 0:
+        return 0.0 if np.ndim(value) == 0 else np.zeros(np.shape(value))
+    # fraction of values <= value, by binary search
+    counts = np.searchsorted(sorted_arr, value, side="right")
+    if np.ndim(counts) == 0:
+        return float(counts) / float(sorted_arr.size)
+    return counts / float(sorted_arr.size)
+
+
+def _dates_at(dates_np: np.ndarray, idx: np.ndarray) -> List[date]:
+    """Python `date` objects for the datetime64 entries at positions idx, converted in bulk."""
+    return dates_np[idx].astype("datetime64[D]").tolist()
 
 
-def _detect_quantile_spikes(df: pd.DataFrame, buffer_pre_days: int = BUFFER_PRE_DAYS_DEFAULT, buffer_post_days: int = BUFFER_POST_DAYS_DEFAULT) -> List[GprEvent]:
+def _runs_above(
+    values: np.ndarray, threshold: float, min_length: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find runs of at least `min_length` consecutive days with values >= threshold.
+
+    Returns parallel arrays (start, stop, peak) of positions, stop exclusive; peak
+    is the first maximum within each run, as idxmax would pick. NaN never qualifies.
+    """
+    # Run-length encode the mask from its rising/falling edges
+    edges = np.diff((values >= threshold).astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    keep = (stops - starts) >= min_length
+    starts, stops = starts[keep], stops[keep]
+    if starts.size == 0:
+        return starts, stops, starts
+
+    # Per-run max over the concatenated runs, then the first position reaching it
+    lengths = stops - starts
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+    run_values = values[positions]
+    run_max = np.maximum.reduceat(run_values, offsets)
+    hits = np.flatnonzero(run_values == np.repeat(run_max, lengths))
+    peaks = positions[hits[np.searchsorted(hits, offsets)]]
+    return starts, stops, peaks
+
+
+def _classify_quantile_spikes(
+    g_values: np.ndarray, sorted_vals: np.ndarray, elevated_q: float, extreme_q: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Numeric core of the quantile-spike detector.
+
+    Returns parallel arrays (indices, is_extreme, percentile) for the days whose
+    full-history percentile reaches `elevated_q`; NaN days never qualify.
+    """
+    # Percentile of every day in one pass: count of values <= gprd[t] via binary search
+    pct_all = _percentile_of(g_values, sorted_vals)
+    pct_all[np.isnan(g_values)] = np.nan
+    idx = np.flatnonzero(pct_all >= elevated_q)
+    pct = pct_all[idx]
+    return idx, pct >= extreme_q, pct
+
+
+def _classify_z_spikes(
+    g_values: np.ndarray, mu: np.ndarray, sigma: np.ndarray, z_thresh: float, half_window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Numeric core of the short-term spike detector.
+
+    A day qualifies when its z-score against the rolling (mu, sigma) reaches
+    `z_thresh` and it is the maximum of the centered window of `half_window` days
+    on each side. Returns parallel arrays (indices, z).
+    """
+    n = g_values.size
+    if n == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+
+    # z-score where the rolling window is complete and has spread (NaN elsewhere)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (g_values - mu) / np.where(sigma > 0, sigma, np.nan)
+
+    # Centered local max ignoring NaN: pad the edges (and NaN days) with -inf
+    padded = np.full(n + 2 * half_window, -np.inf)
+    padded[half_window:half_window + n] = np.where(np.isnan(g_values), -np.inf, g_values)
+    local_max = sliding_window_view(padded, 2 * half_window + 1).max(axis=1)
+
+    idx = np.flatnonzero((z >= z_thresh) & (g_values >= local_max))
+    return idx, z[idx]
+
+
+def _detect_quantile_spikes(
+    df: pd.DataFrame,
+    buffer_pre_days: int = BUFFER_PRE_DAYS_DEFAULT,
+    buffer_post_days: int = BUFFER_POST_DAYS_DEFAULT,
+    sorted_gprd: Optional[np.ndarray] = None,
+) -> List[GprEvent]:
     """Detect per-day quantile spikes against the full-history GPR distribution.
 
     For each day t, compute percentile = fraction of historical gprd values <= gprd[t].
@@ -168,35 +384,37 @@ def _detect_quantile_spikes(df: pd.DataFrame, buffer_pre_days: int = BUFFER_PRE_
     """
     events: List[GprEvent] = []
 
-    g = df["gprd"]
-    full_vals = g.dropna().values
-    if full_vals.size == 0:
+    g_values = df["gprd"].to_numpy(dtype=np.float64)
+    dates_np = df["date"].to_numpy()
+    sorted_vals = sorted_gprd if sorted_gprd is not None else _sorted_finite(df["gprd"])
+    if sorted_vals.size == 0:
         return events
 
-    for i in range(len(df)):
-        val = g.iat[i]
-        if pd.isna(val):
-            continue
+    idx, is_extreme, pcts = _classify_quantile_spikes(g_values, sorted_vals, ELEVATED_SPIKE_Q, EXTREME_SPIKE_Q)
+    median = float(np.median(sorted_vals))
 
-        pct = _percentile_of(val, g)
+    pre_delta = timedelta(days=buffer_pre_days)
+    post_delta = timedelta(days=buffer_post_days)
 
-        if pct >= EXTREME_SPIKE_Q:
+    # severity_score: map percentile to [0,1] in a simple way (e.g., linear above elevated threshold)
+    # severity = min(max((pct - ELEVATED_SPIKE_Q) / (1.0 - ELEVATED_SPIKE_Q), 0.0), 1.0)
+    # but to keep some continuity use pct directly as severity (clipped for all spikes at once)
+    severities = np.clip(pcts, 0.0, 1.0)
+
+    for i, peak_date, extreme, pct, severity in zip(
+        idx.tolist(), _dates_at(dates_np, idx), is_extreme.tolist(), pcts.tolist(), severities.tolist()
+    ):
+        val = g_values[i]
+
+        if extreme:
             ev_type = GprEventType.EXTREME_SPIKE
             label = "Extreme spike"
-        elif pct >= ELEVATED_SPIKE_Q:
+        else:
             ev_type = GprEventType.ELEVATED_SPIKE
             label = "Elevated spike"
-        else:
-            continue
-
-        peak_date = df["date"].iat[i].date()
-        start_date = (df["date"].iat[i] - pd.Timedelta(days=buffer_pre_days)).date()
-        end_date = (df["date"].iat[i] + pd.Timedelta(days=buffer_post_days)).date()
 
-        # severity_score: map percentile to [0,1] in a simple way (e.g., linear above elevated threshold)
-        # severity = min(max((pct - ELEVATED_SPIKE_Q) / (1.0 - ELEVATED_SPIKE_Q), 0.0), 1.0)
-        # but to keep some continuity use pct directly as severity
-        severity = float(min(max(pct, 0.0), 1.0))
+        start_date = peak_date - pre_delta
+        end_date = peak_date + post_delta
 
         ev = GprEvent(
             event_id=f"quantile-spike-{peak_date.isoformat()}",
@@ -205,7 +423,7 @@ def _detect_quantile_spikes(df: pd.DataFrame, buffer_pre_days: int = BUFFER_PRE_
             end_date=end_date,
             peak_date=peak_date,
             gpr_level_at_peak=float(val),
-            gpr_delta_from_baseline=float(val - float(np.nanmedian(full_vals))) if full_vals.size > 0 else 0.0,
+            gpr_delta_from_baseline=float(val - median),
             severity_score=severity,
             percentile=float(pct),
             label=label,
@@ -215,7 +433,7 @@ def _detect_quantile_spikes(df: pd.DataFrame, buffer_pre_days: int = BUFFER_PRE_
     return events
 
 
-def _detect_short_term_spikes(df: pd.DataFrame) -> List[GprEvent]:
+def _detect_short_term_spikes(df: pd.DataFrame, sorted_gprd: Optional[np.ndarray] = None) -> List[GprEvent]:
     """Detect short-term spikes using z-score on 30-day rolling window.
     
     Each spike is assigned a standard temporal window:
@@ -227,36 +445,32 @@ def _detect_short_term_spikes(df: pd.DataFrame) -> List[GprEvent]:
     events: List[GprEvent] = []
 
     g = df["gprd"]
-    mu_30 = g.rolling(window=30, min_periods=30).mean()
-    sigma_30 = g.rolling(window=30, min_periods=30).std()
+    g_np = g.to_numpy(dtype=np.float64)
+    dates_np = df["date"].to_numpy()
+    mu_np = g.rolling(window=30, min_periods=30).mean().to_numpy()
+    sigma_np = g.rolling(window=30, min_periods=30).std().to_numpy()
 
-    full_vals = g.dropna()
+    idx, zs = _classify_z_spikes(g_np, mu_np, sigma_np, Z_THRESHOLD, LOCAL_MAX_WINDOW)
 
-    for i in range(len(df)):
-        if pd.isna(mu_30.iat[i]) or pd.isna(sigma_30.iat[i]) or sigma_30.iat[i] == 0:
-            continue
+    # percentile of each spike within the full history
+    if sorted_gprd is None:
+        sorted_gprd = _sorted_finite(g)
+    pct_np = _percentile_of(g_np[idx], sorted_gprd)
 
-        val = g.iat[i]
-        z = (val - mu_30.iat[i]) / sigma_30.iat[i]
-        if z < Z_THRESHOLD:
-            continue
+    # severity: z-score scaled by 1/5 and clipped to [0,1], for all spikes at once
+    severities = np.clip(zs / 5.0, 0.0, 1.0)
 
-        # local maximum check
-        left = max(0, i - LOCAL_MAX_WINDOW)
-        right = min(len(df) - 1, i + LOCAL_MAX_WINDOW)
-        window_max = g.iloc[left:right + 1].max()
-        if val < window_max:
-            continue
+    for i, peak_date, percentile, severity in zip(
+        idx.tolist(), _dates_at(dates_np, idx), pct_np.tolist(), severities.tolist()
+    ):
+        val = g_np[i]
 
-        peak_date = df["date"].iat[i].date()
         # Standard event window for publication
-        start_date = (df["date"].iat[i] - pd.Timedelta(days=7)).date()
-        end_date = (df["date"].iat[i] + pd.Timedelta(days=2)).date()
+        start_date = peak_date - timedelta(days=7)
+        end_date = peak_date + timedelta(days=2)
         
-        baseline = float(mu_30.iat[i])
+        baseline = float(mu_np[i])
         delta = float(val - baseline)
-        percentile = _percentile_of(val, full_vals)
-        severity = float(min(max(z / 5.0, 0.0), 1.0))
 
         ev = GprEvent(
             event_id=f"spike-{peak_date.isoformat()}",
@@ -275,47 +489,38 @@ def _detect_short_term_spikes(df: pd.DataFrame) -> List[GprEvent]:
     return events
 
 
-def _detect_episodes(df: pd.DataFrame) -> List[GprEvent]:
+def _detect_episodes(df: pd.DataFrame, sorted_ma7: Optional[np.ndarray] = None) -> List[GprEvent]:
     events: List[GprEvent] = []
     ma7 = df["gprd_ma7"]
-    if ma7.dropna().empty:
+    # sorted history computed once; threshold, median and percentiles all read from it
+    if sorted_ma7 is None:
+        sorted_ma7 = _sorted_finite(ma7)
+    if sorted_ma7.size == 0:
         return events
 
-    threshold = float(np.nanpercentile(ma7.values, EPISODE_PERCENTILE * 100.0))
-    mask = ma7 >= threshold
-
-    # group consecutive True values
-    groups = (mask != mask.shift(1)).cumsum()
-    full_ma7 = ma7.dropna()
-    baseline = float(np.nanmedian(ma7.values))
-
-    for g_id, group_df in df.groupby(groups):
-        grp_mask = mask[group_df.index]
-        if not grp_mask.any():
-            continue
-        # consecutive true subgroups within this group
-        sub = group_df[grp_mask]
-        if sub.empty:
-            continue
-        length = len(sub)
-        if length < MIN_EPISODE_DAYS:
-            continue
-
-        start_date = sub["date"].iloc[0].date()
-        end_date = sub["date"].iloc[-1].date()
-
-        peak_idx = sub["gprd_ma7"].idxmax()
-        peak_date = df.at[peak_idx, "date"].date()
-        peak_val = float(df.at[peak_idx, "gprd_ma7"])
+    threshold = float(np.percentile(sorted_ma7, EPISODE_PERCENTILE * 100.0))
+    ma7_np = ma7.to_numpy(dtype=np.float64)
+    starts, stops, peaks = _runs_above(ma7_np, threshold, MIN_EPISODE_DAYS)
+    dates_np = df["date"].to_numpy()
+    baseline = float(np.median(sorted_ma7))
+    peak_vals = ma7_np[peaks]
+    percentiles = _percentile_of(peak_vals, sorted_ma7)
+
+    # simple severity: length * height above baseline, capped at a 0-10 rough score
+    # and normalized to [0,1] for system-wide consistency (all runs at once)
+    raw = (stops - starts) * np.maximum(peak_vals - baseline, 0.0)
+    severities = np.clip(np.minimum(raw / (10.0 + baseline), 10.0) / 10.0, 0.0, 1.0)
+
+    for start_date, end_date, peak_date, peak_val, percentile, severity in zip(
+        _dates_at(dates_np, starts),
+        _dates_at(dates_np, stops - 1),
+        _dates_at(dates_np, peaks),
+        peak_vals.tolist(),
+        percentiles.tolist(),
+        severities.tolist(),
+    ):
 
         delta = float(peak_val - baseline)
-        # simple severity: length * height, normalized to 0-10 range
-        raw = float(length * max(peak_val - baseline, 0.0))
-        # raw severity metric (unbounded-ish), then scaled to a 0-10 rough score
-        raw_severity = min(raw / (10.0 + baseline), 10.0)
-        # Normalize severity to [0,1] for system-wide consistency
-        severity = float(min(max(raw_severity / 10.0, 0.0), 1.0))
-        percentile = _percentile_of(peak_val, full_ma7)
 
         ev = GprEvent(
             event_id=f"episode-{start_date.isoformat()}-{end_date.isoformat()}",
@@ -334,44 +539,38 @@ def _detect_episodes(df: pd.DataFrame) -> List[GprEvent]:
     return events
 
 
-def _detect_regimes(df: pd.DataFrame) -> List[GprEvent]:
+def _detect_regimes(df: pd.DataFrame, sorted_ma30: Optional[np.ndarray] = None) -> List[GprEvent]:
     events: List[GprEvent] = []
     ma30 = df["gprd_ma30"]
-    if ma30.dropna().empty:
+    # sorted history computed once; threshold, median and percentiles all read from it
+    if sorted_ma30 is None:
+        sorted_ma30 = _sorted_finite(ma30)
+    if sorted_ma30.size == 0:
         return events
 
-    threshold = float(np.nanpercentile(ma30.values, REGIME_PERCENTILE * 100.0))
-    mask = ma30 >= threshold
-
-    groups = (mask != mask.shift(1)).cumsum()
-    full_ma30 = ma30.dropna()
-    baseline = float(np.nanmedian(ma30.values))
-
-    for g_id, group_df in df.groupby(groups):
-        grp_mask = mask[group_df.index]
-        if not grp_mask.any():
-            continue
-        sub = group_df[grp_mask]
-        if sub.empty:
-            continue
-        length = len(sub)
-        if length < MIN_REGIME_DAYS:
-            continue
-
-        start_date = sub["date"].iloc[0].date()
-        end_date = sub["date"].iloc[-1].date()
-
-        peak_idx = sub["gprd_ma30"].idxmax()
-        peak_date = df.at[peak_idx, "date"].date()
-        peak_val = float(df.at[peak_idx, "gprd_ma30"])
+    threshold = float(np.percentile(sorted_ma30, REGIME_PERCENTILE * 100.0))
+    ma30_np = ma30.to_numpy(dtype=np.float64)
+    starts, stops, peaks = _runs_above(ma30_np, threshold, MIN_REGIME_DAYS)
+    dates_np = df["date"].to_numpy()
+    baseline = float(np.median(sorted_ma30))
+    peak_vals = ma30_np[peaks]
+    percentiles = _percentile_of(peak_vals, sorted_ma30)
+
+    # simple severity: length * height above baseline, capped at a 0-10 rough score
+    # and normalized to [0,1] for system-wide consistency (all runs at once)
+    raw = (stops - starts) * np.maximum(peak_vals - baseline, 0.0)
+    severities = np.clip(np.minimum(raw / (50.0 + baseline), 10.0) / 10.0, 0.0, 1.0)
+
+    for start_date, end_date, peak_date, peak_val, percentile, severity in zip(
+        _dates_at(dates_np, starts),
+        _dates_at(dates_np, stops - 1),
+        _dates_at(dates_np, peaks),
+        peak_vals.tolist(),
+        percentiles.tolist(),
+        severities.tolist(),
+    ):
 
         delta = float(peak_val - baseline)
-        raw = float(length * max(peak_val - baseline, 0.0))
-        # raw severity metric (unbounded-ish), then scaled to a 0-10 rough score
-        raw_severity = min(raw / (50.0 + baseline), 10.0)
-        # Normalize severity to [0,1] for system-wide consistency
-        severity = float(min(max(raw_severity / 10.0, 0.0), 1.0))
-        percentile = _percentile_of(peak_val, full_ma30)
 
         ev = GprEvent(
             event_id=f"regime-{start_date.isoformat()}-{end_date.isoformat()}",
@@ -8,14 +8,30 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 import logging
+import os
+import tempfile
 
+import numpy as np
 import pandas as pd
 
-from gpr_overlay.data_models.gpr_series import GprDailyPoint
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    # Multithreaded Arrow CSV reader with typed columns; C engine otherwise
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = None
+    feather = None
+    CSV_ENGINE = "c"
+
+from gpr_overlay.data_models.gpr_series import GprDailyPoint, GprDailySeries
 
 
 logger = logging.getLogger(__name__)
 
+# Feather schema metadata key recording the size and mtime of the source CSV
+_SIDECAR_SOURCE_KEY = b"gpr_source_stat"
+
 
 def ingest_gpr_from_csv(csv_path: Path) -> List[GprDailyPoint]:
     """Read a raw GPR CSV and return a list of `GprDailyPoint`.
@@ -25,18 +41,18 @@ def ingest_gpr_from_csv(csv_path: Path) -> List[GprDailyPoint]:
     obvious columns if present.
     """
 
-    df = pd.read_csv(csv_path)
-    points: List[GprDailyPoint] = []
+    df = pd.read_csv(csv_path, engine=CSV_ENGINE)
+    n = len(df)
 
     # Minimal mapping - TODO: robust parsing
-    for _, row in df.iterrows():
-        point = GprDailyPoint(
-            date=pd.to_datetime(row["date"]).date() if "date" in row else None,  # type: ignore[arg-type]
-            gprd=float(row["gprd"]) if "gprd" in row and not pd.isna(row["gprd"]) else 0.0,
-        )
-        points.append(point)
+    # Columns are extracted once rather than iterating rows
+    dates = pd.to_datetime(df["date"]).dt.date.tolist() if "date" in df.columns else [None] * n
+    gprd = df["gprd"].fillna(0.0).astype(float).tolist() if "gprd" in df.columns else [0.0] * n
 
-    return points
+    return [
+        GprDailyPoint(date=d, gprd=g)  # type: ignore[arg-type]
+        for d, g in zip(dates, gprd)
+    ]
 
 
 def store_gpr_series(points: List[GprDailyPoint], repository) -> None:
@@ -52,7 +68,7 @@ def store_gpr_series(points: List[GprDailyPoint], repository) -> None:
     repository.upsert_gpr_daily_series(points)
 
 
-def load_gpr_daily_from_csv(csv_path: Path | str) -> List[GprDailyPoint]:
+def load_gpr_daily_from_csv(csv_path: Path | str, use_feather_cache: bool = False) -> List[GprDailyPoint]:
     """Load the cleaned GPR daily CSV into a list of GprDailyPoint objects.
 
     Parameters
@@ -60,6 +76,8 @@ def load_gpr_daily_from_csv(csv_path: Path | str) -> List[GprDailyPoint]:
     csv_path : Path | str
         Path to data/raw/gpr_daily_original/gpr_daily_recent.csv
         or any other CSV file with the same column structure.
+    use_feather_cache : bool
+        Read through the Feather sidecar (see `load_gpr_daily_df`).
 
     Returns
     -------
@@ -71,7 +89,162 @@ def load_gpr_daily_from_csv(csv_path: Path | str) -> List[GprDailyPoint]:
     if not path.exists():
         raise FileNotFoundError(f"GPR CSV file not found: {path}")
 
-    df = pd.read_csv(path)
+    df = _normalise_gpr_columns(_read_gpr_csv(path, use_feather_cache))
+    points = gpr_points_from_df(df)
+
+    logger.info("Loaded %d GPR daily points from %s", len(points), path)
+    return points
+
+
+def load_gpr_daily_df(csv_path: Path | str, use_feather_cache: bool = False) -> pd.DataFrame:
+    """Load the GPR daily CSV as a DataFrame without building pydantic points.
+
+    Column names are upper-cased as in `load_gpr_daily_from_csv` and DATE is
+    parsed to datetime64.
+
+    Parameters
+    ----------
+    csv_path : Path | str
+        Path to a CSV accepted by `load_gpr_daily_from_csv`.
+    use_feather_cache : bool
+        If True and pyarrow is installed, keep a Feather sidecar
+        (``<name>.feather``) next to the CSV and reuse it while the CSV's size
+        and modification time match the ones recorded in it. Off by default
+        so a plain read never writes into the data directory; long-lived
+        callers that re-read the same CSV (the API, the demo CLI) turn it on.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per daily observation, in file order.
+    """
+
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"GPR CSV file not found: {path}")
+
+    df = _normalise_gpr_columns(_read_gpr_csv(path, use_feather_cache))
+    df["DATE"] = pd.to_datetime(df["DATE"])
+    return df
+
+
+def _read_gpr_csv(path: Path, use_feather_cache: bool) -> pd.DataFrame:
+    """Raw frame of a GPR CSV, through its Feather sidecar when requested and available."""
+    if use_feather_cache and feather is not None:
+        return _read_with_feather_sidecar(path)
+    return pd.read_csv(path, engine=CSV_ENGINE)
+
+
+def _read_with_feather_sidecar(path: Path) -> pd.DataFrame:
+    """Raw CSV frame served from or saved to its Feather sidecar (see `load_gpr_daily_df`)."""
+    sidecar = path.with_suffix(".feather")
+    stat = path.stat()
+    # Exact match rather than "sidecar is newer", so a CSV restored with an
+    # older mtime is not served stale data
+    source_stat = f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+    if sidecar.exists():
+        try:
+            table = feather.read_table(sidecar)
+            if (table.schema.metadata or {}).get(_SIDECAR_SOURCE_KEY) == source_stat:
+                return table.to_pandas()
+        except (OSError, pa.ArrowException):
+            logger.warning("Ignoring unreadable GPR cache %s", sidecar)
+
+    df = pd.read_csv(path, engine=CSV_ENGINE)
+    tmp_name = None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _SIDECAR_SOURCE_KEY: source_stat}
+        # Write to a temporary file and rename, so concurrent readers (API
+        # requests) never see a half-written sidecar
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{sidecar.stem}-", suffix=".feather", dir=sidecar.parent)
+        os.close(fd)
+        feather.write_feather(table.replace_schema_metadata(metadata), tmp_name, compression="uncompressed")
+        os.replace(tmp_name, sidecar)
+    except (OSError, pa.ArrowException):
+        # Read-only data directory or a frame Arrow cannot store: the cache is best-effort
+        logger.warning("Could not write GPR cache %s", sidecar)
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return df
+
+
+def gpr_series_from_df(df: pd.DataFrame) -> GprDailySeries:
+    """Take the detection columns of a GPR daily frame (upper-cased columns) as arrays.
+
+    The column-wise counterpart of `gpr_points_from_df` for `detect_gpr_events`;
+    no per-row objects are built. Missing moving-average columns become NaN.
+    """
+
+    def _float_column(name: str) -> np.ndarray:
+        if name not in df.columns:
+            return np.full(len(df), np.nan)
+        return df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return GprDailySeries.model_construct(
+        dates=pd.to_datetime(df["DATE"]).to_numpy(dtype="datetime64[D]"),
+        gprd=df["GPRD"].to_numpy(dtype=np.float64),
+        gprd_ma7=_float_column("GPRD_MA7"),
+        gprd_ma30=_float_column("GPRD_MA30"),
+    )
+
+
+def gpr_points_from_df(df: pd.DataFrame) -> List[GprDailyPoint]:
+    """Convert a GPR daily frame with upper-cased columns into points.
+
+    Use this only where downstream services need `GprDailyPoint` objects;
+    column-wise consumers can work on the frame from `load_gpr_daily_df`.
+    Every value is coerced to its field type below, so points are built with
+    `model_construct` and skip pydantic validation.
+    """
+
+    # Pull each column out once instead of materialising a Series per row
+    n = len(df)
+    dates = pd.to_datetime(df["DATE"]).dt.date.tolist()
+    gprd = df["GPRD"].to_numpy(dtype=np.float64).tolist()
+
+    def _opt_float_column(name: str) -> list:
+        # One NaN mask per column; missing values become None
+        if name not in df.columns:
+            return [None] * n
+        values = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        out = values.astype(object)
+        out[np.isnan(values)] = None
+        return out.tolist()
+
+    if "EVENT" in df.columns:
+        missing = df["EVENT"].isna().to_numpy()
+        events = [None if m else str(ev) for ev, m in zip(df["EVENT"].tolist(), missing.tolist())]
+    else:
+        events = [None] * n
+
+    return [
+        GprDailyPoint.model_construct(
+            date=d,
+            n10d=n10d,
+            gprd=g,
+            gprd_act=act,
+            gprd_threat=threat,
+            gprd_ma30=ma30,
+            gprd_ma7=ma7,
+            event=ev,
+        )
+        for d, g, n10d, act, threat, ma30, ma7, ev in zip(
+            dates,
+            gprd,
+            _opt_float_column("N10D"),
+            _opt_float_column("GPRD_ACT"),
+            _opt_float_column("GPRD_THREAT"),
+            _opt_float_column("GPRD_MA30"),
+            _opt_float_column("GPRD_MA7"),
+            events,
+        )
+    ]
+
+
+def _normalise_gpr_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Upper-case column names and check the required GPR columns are present."""
 
     # Normalise column names to upper-case to be robust
     df.columns = [str(c).strip().upper() for c in df.columns]
@@ -80,21 +253,4 @@ def load_gpr_daily_from_csv(csv_path: Path | str) -> List[GprDailyPoint]:
     missing = required_cols - set(df.columns)
     if missing:
         raise ValueError(f"Missing required columns in GPR CSV: {missing}")
-
-    points: List[GprDailyPoint] = []
-
-    for _, row in df.iterrows():
-        point = GprDailyPoint(
-            date=pd.to_datetime(row["DATE"]).date(),
-            n10d=float(row["N10D"]) if "N10D" in df.columns and pd.notna(row["N10D"]) else None,
-            gprd=float(row["GPRD"]),
-            gprd_act=float(row["GPRD_ACT"]) if "GPRD_ACT" in df.columns and pd.notna(row["GPRD_ACT"]) else None,
-            gprd_threat=float(row["GPRD_THREAT"]) if "GPRD_THREAT" in df.columns and pd.notna(row["GPRD_THREAT"]) else None,
-            gprd_ma30=float(row["GPRD_MA30"]) if "GPRD_MA30" in df.columns and pd.notna(row["GPRD_MA30"]) else None,
-            gprd_ma7=float(row["GPRD_MA7"]) if "GPRD_MA7" in df.columns and pd.notna(row["GPRD_MA7"]) else None,
-            event=str(row["EVENT"]) if "EVENT" in df.columns and pd.notna(row["EVENT"]) else None,
-        )
-        points.append(point)
-
-    logger.info("Loaded %d GPR daily points from %s", len(points), path)
-    return points
+    return df
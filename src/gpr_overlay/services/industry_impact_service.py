@@ -1,7 +1,7 @@
 from typing import List
 import logging
 
-import math
+import numpy as np
 
 from gpr_overlay.data_models.gpr_event import GprEvent
 from gpr_overlay.data_models.industry_exposure import IndustryExposure
@@ -35,58 +35,87 @@ def compute_event_portfolio_impact(
     else:
         severity = float(severity)
 
-    industries: List[EventIndustryImpact] = []
-    total_negative = 0.0
-    total_positive = 0.0
-
-    for e in exposures:
-        # skip industries with no weight or missing beta
-        try:
-            pw = float(e.portfolio_weight)
-        except Exception:
-            continue
-        if pw <= 0.0 or e.gpr_beta is None:
-            continue
-
-        beta = float(e.gpr_beta)
-        impact = severity * (pw / 100.0) * beta
-
-        if beta < -EPS:
-            direction = "negative"
-            total_negative += impact
-        elif beta > EPS:
-            direction = "positive"
-            total_positive += impact
-        else:
-            direction = "neutral"
-
-        contrib = e.contribution_to_vulnerability if e.contribution_to_vulnerability is not None else (pw / 100.0) * beta
+    # Weight / beta columns; exposures with no weight or missing beta are skipped
+    pw_arr = np.fromiter((float(e.portfolio_weight) for e in exposures), dtype=np.float64, count=len(exposures))
+    beta_arr = np.fromiter(
+        (float(e.gpr_beta) if e.gpr_beta is not None else np.nan for e in exposures),
+        dtype=np.float64,
+        count=len(exposures),
+    )
+    valid = ~(pw_arr <= 0.0) & ~np.isnan(beta_arr)
+    keep = np.flatnonzero(valid)
+    pw_arr = pw_arr[keep]
+    beta_arr = beta_arr[keep]
+
+    exposure_frac = pw_arr / 100.0
+    impact_arr = severity * exposure_frac * beta_arr
+    negative = beta_arr < -EPS
+    positive = beta_arr > EPS
+    directions = np.where(negative, "negative", np.where(positive, "positive", "neutral")).tolist()
+
+    total_negative = float(impact_arr[negative].sum())
+    total_positive = float(impact_arr[positive].sum())
+
+    # Weight shares of the whole portfolio and of the vulnerable industries
+    # (zero when the corresponding total is not positive)
+    total_portfolio_weight = float(pw_arr.sum())
+    total_vulnerable_weight = float(pw_arr[negative].sum())
+    if total_portfolio_weight > 0:
+        share_arr = pw_arr / total_portfolio_weight
+    else:
+        share_arr = np.zeros_like(pw_arr)
+    if total_vulnerable_weight > 0:
+        vuln_share_arr = np.where(negative, pw_arr / total_vulnerable_weight, 0.0)
+    else:
+        vuln_share_arr = np.zeros_like(pw_arr)
 
+    industries: List[EventIndustryImpact] = []
+    for k, (i, pw, beta, impact, direction, share, vuln_share) in enumerate(
+        zip(
+            keep.tolist(),
+            pw_arr.tolist(),
+            beta_arr.tolist(),
+            impact_arr.tolist(),
+            directions,
+            share_arr.tolist(),
+            vuln_share_arr.tolist(),
+        )
+    ):
+        e = exposures[i]
+        contrib = e.contribution_to_vulnerability if e.contribution_to_vulnerability is not None else exposure_frac[k] * beta
+        # Every value comes from a validated exposure or the float arrays above,
+        # so the impact record is built without re-running pydantic validation
         industries.append(
-            EventIndustryImpact(
+            EventIndustryImpact.model_construct(
                 fed_industry_id=e.fed_industry_id,
                 fed_industry_name=e.fed_industry_name,
                 portfolio_weight=pw,
                 gpr_beta=beta,
-                impact_score=float(impact),
+                impact_score=impact,
                 direction=direction,
                 gpr_sentiment=e.gpr_sentiment,
-                contribution_to_vulnerability=float(contrib) if contrib is not None else None,
+                contribution_to_vulnerability=float(contrib),
+                industry_weight_share_of_portfolio=share,
+                industry_weight_share_of_vulnerable=vuln_share,
             )
         )
 
-    # Sort vulnerable and resilient lists by absolute impact descending
-    vulnerable = [i for i in industries if i.direction == "negative"]
-    resilient = [i for i in industries if i.direction == "positive"]
-
-    vulnerable.sort(key=lambda x: abs(x.impact_score), reverse=True)
-    resilient.sort(key=lambda x: abs(x.impact_score), reverse=True)
+    # Sort vulnerable and resilient lists by absolute impact descending (stable on ties)
+    abs_impact = np.abs(impact_arr)
+    neg_idx = np.flatnonzero(negative)
+    pos_idx = np.flatnonzero(positive)
+    vulnerable = [industries[i] for i in neg_idx[np.argsort(-abs_impact[neg_idx], kind="stable")].tolist()]
+    resilient = [industries[i] for i in pos_idx[np.argsort(-abs_impact[pos_idx], kind="stable")].tolist()]
 
     net = total_positive + total_negative
 
     baseline = compute_portfolio_gpr_vulnerability(exposures)
 
-    profile = EventImpactProfile(
+    vulnerable_count = len(vulnerable)
+    total_count = len(industries)
+    vulnerable_weight_share = float(total_vulnerable_weight / total_portfolio_weight) if total_portfolio_weight > 0 else 0.0
+
+    return EventImpactProfile(
         event=event,
         industries=industries,
         vulnerable_industries=vulnerable,
@@ -95,39 +124,12 @@ def compute_event_portfolio_impact(
         total_positive_impact=float(total_positive),
         net_impact=float(net),
         portfolio_vulnerability_baseline=float(baseline),
+        vulnerability_composition={
+            "vulnerable_weight_share": float(vulnerable_weight_share),
+            "non_vulnerable_weight_share": float(1.0 - vulnerable_weight_share),
+            "vulnerable_industry_count": int(vulnerable_count),
+            "total_industry_count": int(total_count),
+            "vulnerable_industry_share": float(vulnerable_count / total_count) if total_count > 0 else 0.0,
+            "non_vulnerable_industry_share": float(1.0 - (vulnerable_count / total_count)) if total_count > 0 else 0.0,
+        },
     )
-
-    # Compute composition metrics and per-industry shares
-    total_portfolio_weight = sum([it.portfolio_weight for it in industries]) if industries else 0.0
-    total_vulnerable_weight = sum([it.portfolio_weight for it in vulnerable]) if vulnerable else 0.0
-
-    # Avoid division by zero
-    for it in profile.industries:
-        try:
-            it_ind = it
-            if total_portfolio_weight > 0:
-                it_ind.industry_weight_share_of_portfolio = float(it_ind.portfolio_weight / total_portfolio_weight)
-            else:
-                it_ind.industry_weight_share_of_portfolio = 0.0
-
-            if total_vulnerable_weight > 0 and it_ind.direction == "negative":
-                it_ind.industry_weight_share_of_vulnerable = float(it_ind.portfolio_weight / total_vulnerable_weight)
-            else:
-                it_ind.industry_weight_share_of_vulnerable = 0.0
-        except Exception:
-            continue
-
-    vulnerable_count = len(vulnerable)
-    total_count = len(industries)
-    vulnerable_weight_share = float(total_vulnerable_weight / total_portfolio_weight) if total_portfolio_weight > 0 else 0.0
-
-    profile.vulnerability_composition = {
-        "vulnerable_weight_share": float(vulnerable_weight_share),
-        "non_vulnerable_weight_share": float(1.0 - vulnerable_weight_share),
-        "vulnerable_industry_count": int(vulnerable_count),
-        "total_industry_count": int(total_count),
-        "vulnerable_industry_share": float(vulnerable_count / total_count) if total_count > 0 else 0.0,
-        "non_vulnerable_industry_share": float(1.0 - (vulnerable_count / total_count)) if total_count > 0 else 0.0,
-    }
-
-    return profile
@@ -6,16 +6,26 @@ with explanatory docstrings.
 """
 from __future__ import annotations
 
-from typing import List, Any, Dict, Tuple
-from gpr_overlay.data_models.portfolio_snapshot import PortfolioSnapshot
+from typing import Iterable, List, Any, Dict, Tuple
+import heapq
+from gpr_overlay.data_models.portfolio_snapshot import PortfolioHolding, PortfolioSnapshot
 from gpr_overlay.data_models.industry_exposure import IndustryExposure
 from pathlib import Path
 import logging
+import math
+import numpy as np
 import pandas as pd
-from io import StringIO
+from io import BytesIO
+import re
 
 logger = logging.getLogger(__name__)
 
+# Placeholders treated as missing numeric values in portfolio CSVs
+_NA_STRINGS = frozenset({"unknown", "na", "n/a", "-"})
+
+# Markdown/code fence line (```csv, ```) including its line break
+_FENCE_LINE_RE = re.compile(rb"^[^\S\r\n]*```[^\r\n]*(?:\r\n|\r|\n|$)", re.MULTILINE)
+
 
 def compute_portfolio_industry_exposure(snapshot: PortfolioSnapshot) -> List[IndustryExposure]:
     """Compute industry-level exposures from a portfolio snapshot.
@@ -28,85 +38,173 @@ def compute_portfolio_industry_exposure(snapshot: PortfolioSnapshot) -> List[Ind
 
     Returns a list of `IndustryExposure` objects (one per industry).
     """
-    groups: Dict[str, List] = {}
-    name_map: Dict[str, str] = {}
+    # One frame of the needed columns (cached on the snapshot), reduced to
+    # parallel arrays keyed by industry code in first-appearance order
+    df = snapshot.holdings_df[
+        ["fed_industry_id", "fed_industry_name", "weight_pct", "gpr_beta", "gpr_sentiment"]
+    ].dropna(subset=["fed_industry_id", "gpr_beta"])
+    if df.empty:
+        return []
+
+    gids, ind_ids = pd.factorize(df["fed_industry_id"])
+    n_groups = len(ind_ids)
+    portfolio_weights, weighted_nums, weighted_dens, sentiment_sums, sentiment_counts = _aggregate_industries(
+        gids,
+        df["weight_pct"].to_numpy(dtype=np.float64),
+        df["gpr_beta"].to_numpy(dtype=np.float64),
+        df["gpr_sentiment"].to_numpy(dtype=np.float64, na_value=np.nan),
+        n_groups,
+    )
 
-    for h in snapshot.holdings:
-        if h.fed_industry_id is None:
-            continue
-        if h.gpr_beta is None:
-            continue
-        key = h.fed_industry_id
-        groups.setdefault(key, []).append(h)
-        if key not in name_map and h.fed_industry_name:
-            name_map[key] = h.fed_industry_name
-
-    exposures: List[IndustryExposure] = []
-
-    for ind_id, holdings in groups.items():
-        # Sum portfolio weight as percent
-        portfolio_weight = float(sum(h.weight_pct for h in holdings))
-
-        # Compute weight-fraction-weighted average of gpr_beta
-        # w_i = weight_pct / 100
-        weighted_num = 0.0
-        weighted_den = 0.0
-        sentiments = []
-        for h in holdings:
-            w_frac = float(h.weight_pct) / 100.0
-            weighted_num += w_frac * float(h.gpr_beta)
-            weighted_den += w_frac
-            if h.gpr_sentiment is not None:
-                sentiments.append(float(h.gpr_sentiment))
-
-        if weighted_den <= 1e-8:
-            # Defensive guard: if total fractional weight is effectively zero,
-            # the weighted beta cannot be computed reliably. Skip the industry
-            # and emit a warning for auditing.
-            logger.warning(
-                "Skipping industry %s because total weight fraction is zero or too small; cannot compute weighted beta",
-                ind_id,
-            )
-            continue
-        else:
-            avg_beta = weighted_num / weighted_den
-
-        avg_sentiment = float(sum(sentiments) / len(sentiments)) if sentiments else None
-
-        exposures.append(
-            IndustryExposure(
-                fed_industry_id=ind_id,
-                fed_industry_name=name_map.get(ind_id, ind_id),
-                portfolio_weight=portfolio_weight,
-                gpr_beta=avg_beta,
-                gpr_sentiment=avg_sentiment,
-            )
+    # First non-empty industry name seen for each id (falls back to the id)
+    names = df["fed_industry_name"].to_numpy(dtype=object)
+    named = np.flatnonzero(pd.notna(names) & (names != ""))
+    name_groups, first_named = np.unique(gids[named], return_index=True)
+    name_by_group = dict(zip(name_groups.tolist(), names[named[first_named]].tolist()))
+
+    # Simple average of the non-null sentiments (None when there are none)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_sentiments = sentiment_sums / sentiment_counts
+        betas = weighted_nums / weighted_dens
+
+    # Defensive guard: if total fractional weight is effectively zero, the
+    # weighted beta cannot be computed reliably. Skip the industry and emit a
+    # warning for auditing.
+    keep = weighted_dens > 1e-8
+    for g in np.flatnonzero(~keep).tolist():
+        logger.warning(
+            "Skipping industry %s because total weight fraction is zero or too small; cannot compute weighted beta",
+            ind_ids[g],
         )
 
+    # Ids/names are str and the aggregates plain floats (None for no sentiment),
+    # exactly the field types, so construction skips pydantic validation
+    kept = np.flatnonzero(keep)
+    exposures: List[IndustryExposure] = [
+        IndustryExposure.model_construct(
+            fed_industry_id=ind_id,
+            fed_industry_name=name_by_group.get(g) or ind_id,
+            portfolio_weight=portfolio_weight,
+            gpr_beta=beta,
+            gpr_sentiment=avg_sentiment if count else None,
+        )
+        for g, ind_id, portfolio_weight, beta, avg_sentiment, count in zip(
+            kept.tolist(),
+            ind_ids[kept].tolist(),
+            portfolio_weights[kept].tolist(),
+            betas[kept].tolist(),
+            avg_sentiments[kept].tolist(),
+            sentiment_counts[kept].tolist(),
+        )
+    ]
+
     return exposures
 
 
+def _aggregate_industries(
+    gids: np.ndarray,
+    weight_pct: np.ndarray,
+    gpr_beta: np.ndarray,
+    gpr_sentiment: np.ndarray,
+    n_groups: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-industry sums over parallel holding arrays, one bincount sweep each.
+
+    `gids` are industry codes in [0, n_groups); NaN sentiments are left out.
+    Returns (weight_pct sum, sum of w*beta, sum of w, sentiment sum, sentiment
+    count) per industry, where w = weight_pct / 100.
+    """
+    w_frac = weight_pct / 100.0
+    has_sentiment = ~np.isnan(gpr_sentiment)
+    return (
+        np.bincount(gids, weights=weight_pct, minlength=n_groups),
+        np.bincount(gids, weights=w_frac * gpr_beta, minlength=n_groups),
+        np.bincount(gids, weights=w_frac, minlength=n_groups),
+        np.bincount(gids[has_sentiment], weights=gpr_sentiment[has_sentiment], minlength=n_groups),
+        np.bincount(gids[has_sentiment], minlength=n_groups),
+    )
+
+
 def compute_portfolio_gpr_vulnerability(exposures: List[IndustryExposure]) -> float:
     """Compute a scalar vulnerability score for a portfolio from exposures.
 
     A simple formula (example): sum(portfolio_weight * gpr_beta).
     This function returns that metric; future improvements may incorporate
-    sentiment and convexity adjustments.
+    sentiment and convexity adjustments. The sum is an exactly rounded
+    `math.fsum`, so the score does not depend on the order of `exposures`.
     """
 
-    total = 0.0
-    for e in exposures:
-        try:
-            w_frac = float(e.portfolio_weight) / 100.0
-        except Exception:
-            w_frac = 0.0
-        if w_frac == 0.0 or e.gpr_beta is None:
-            e.contribution_to_vulnerability = 0.0
-            continue
-        contrib = w_frac * float(e.gpr_beta)
+    n = len(exposures)
+    w_frac = np.fromiter((e.portfolio_weight for e in exposures), dtype=np.float64, count=n) / 100.0
+    has_beta = np.fromiter((e.gpr_beta is not None for e in exposures), dtype=bool, count=n)
+    beta = np.fromiter(
+        (e.gpr_beta if e.gpr_beta is not None else 0.0 for e in exposures), dtype=np.float64, count=n
+    )
+    # Zero weight or missing beta contributes nothing
+    contribs = np.where((w_frac != 0.0) & has_beta, w_frac * beta, 0.0)
+
+    contrib_list = contribs.tolist()
+    for e, contrib in zip(exposures, contrib_list):
         e.contribution_to_vulnerability = contrib
-        total += contrib
-    return float(total)
+    # Exactly rounded sum, independent of summation order
+    return math.fsum(contrib_list)
+
+
+def compute_industry_shortlists(
+    snapshot: PortfolioSnapshot,
+    industry_names: Iterable[str],
+    per_industry: int,
+) -> Dict[str, List[PortfolioHolding]]:
+    """Top `per_industry` holdings by `weight_pct` for each selected industry.
+
+    Holdings are grouped by `fed_industry_name` (missing names group under
+    "__unknown__"); missing weights rank as 0.0. Industries appear in order of
+    their first holding and ties keep portfolio order.
+    """
+    selected = set(industry_names)
+    by_industry: Dict[str, List[PortfolioHolding]] = {}
+    for h in snapshot.holdings:
+        name = h.fed_industry_name or "__unknown__"
+        if name in selected:
+            by_industry.setdefault(name, []).append(h)
+
+    # nlargest keeps a bounded heap per industry and, like a stable sort,
+    # keeps portfolio order among equal weights
+    return {
+        name: heapq.nlargest(per_industry, group, key=lambda h: h.weight_pct or 0.0)
+        for name, group in by_industry.items()
+    }
+
+
+def _non_empty_unique(df: pd.DataFrame, col: str) -> List[str]:
+    """Distinct non-empty values of a string column (empty list if the column is absent)."""
+    if col not in df.columns:
+        return []
+    values = df[col]
+    return values[values != ""].unique().tolist()
+
+
+def _parse_numeric_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Vectorized safe float parsing of a string column into a float64 array.
+
+    Blanks and the placeholders 'unknown', 'na', 'n/a' and '-' (any case) are
+    missing; thousands apostrophes used in Swiss formatting (e.g. 2'847'611.40)
+    are removed. Missing or unparseable values are NaN, and an absent column
+    is all NaN.
+    """
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    s = df[col].str.strip()
+    placeholder = (s == "") | s.str.lower().isin(_NA_STRINGS)
+    values = pd.to_numeric(s.str.replace("'", "", regex=False).mask(placeholder), errors="coerce")
+    return values.to_numpy(dtype=np.float64)
+
+
+def _optional_floats(values: np.ndarray) -> List[float | None]:
+    """Python floats for a float64 array, with None in place of NaN."""
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
 
 
 def load_portfolio_snapshot_from_csv(
@@ -119,100 +217,105 @@ def load_portfolio_snapshot_from_csv(
     This loader is tolerant to Markdown/code fences (```csv ... ```) that
     may wrap the CSV in the file. It strips such fence lines before parsing.
 
-    Uses `csv.DictReader` for robust parsing when rows have irregular field counts,
-    and performs safe numeric conversions for `weight_pct` and `mapping_confidence`.
+    Parses with `pandas.read_csv`, reading every field as a string; rows with
+    missing trailing fields get empty strings and extra trailing fields are
+    ignored. Performs safe numeric conversions for `weight_pct` and `mapping_confidence`.
     """
-    import csv
-
     path = Path(csv_path)
     if not path.exists():
         raise FileNotFoundError(f"Portfolio CSV file not found: {path}")
 
-    # Read file text and remove markdown/code fence lines
-    text = path.read_text(encoding="utf-8")
-    cleaned_lines = [ln for ln in text.splitlines() if not ln.strip().startswith("```")]
-    cleaned_text = "\n".join(cleaned_lines)
+    # Read the file once; fence lines are dropped in a single regex pass only
+    # when present, and BytesIO shares the buffer instead of copying it
+    data = path.read_bytes()
+    if b"```" in data:
+        data = _FENCE_LINE_RE.sub(b"", data)
 
-    # Parse with csv.DictReader which maps header -> values; extra fields are ignored.
-    reader = csv.DictReader(StringIO(cleaned_text))
-    rows = list(reader)
+    # Parse with the C reader, all fields as strings and no NA inference; the
+    # callable usecols makes it tolerate rows with extra trailing fields.
+    try:
+        df = pd.read_csv(BytesIO(data), encoding="utf-8", dtype=str, keep_default_na=False, usecols=lambda _: True)
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame()
 
-    if not rows:
+    if df.empty:
         raise ValueError(f"No rows found in {path} after parsing")
 
-    # Optionally filter rows by fund_name / as_of_date early
-    if fund_name_filter is not None:
-        rows = [r for r in rows if r.get("fund_name") == fund_name_filter]
+    # Optionally filter rows by fund_name / as_of_date early (a missing column matches nothing)
+    for col, wanted in (("fund_name", fund_name_filter), ("as_of_date", as_of_date_filter)):
+        if wanted is not None:
+            df = df[df[col] == wanted] if col in df.columns else df.iloc[0:0]
 
-    if as_of_date_filter is not None:
-        rows = [r for r in rows if r.get("as_of_date") == as_of_date_filter]
-
-    if not rows:
+    if df.empty:
         raise ValueError(
             f"No rows found in {path} for fund_name={fund_name_filter!r} "
             f"and as_of_date={as_of_date_filter!r}"
         )
 
-    # Infer fund_name and as_of_date from parsed rows (expect exactly one unique each)
-    fund_name_values = sorted({r.get("fund_name") for r in rows if r.get("fund_name") is not None})
+    # Infer fund_name and as_of_date from parsed rows (expect exactly one unique
+    # non-empty value each; short rows leave them ""). Hash-based unique, sorted
+    # only for the error message
+    fund_name_values = _non_empty_unique(df, "fund_name")
     if len(fund_name_values) != 1:
-        raise ValueError(f"Expected exactly one fund_name, got: {fund_name_values!r}")
+        raise ValueError(f"Expected exactly one fund_name, got: {sorted(fund_name_values)!r}")
     fund_name = fund_name_values[0]
 
-    as_of_date_values = sorted({r.get("as_of_date") for r in rows if r.get("as_of_date") is not None})
+    as_of_date_values = _non_empty_unique(df, "as_of_date")
     if len(as_of_date_values) != 1:
-        raise ValueError(f"Expected exactly one as_of_date, got: {as_of_date_values!r}")
+        raise ValueError(f"Expected exactly one as_of_date, got: {sorted(as_of_date_values)!r}")
     as_of_date = pd.to_datetime(as_of_date_values[0]).date()
 
     holdings: List = []
     from gpr_overlay.data_models.portfolio_snapshot import PortfolioHolding
 
-    def safe_float(val: str | None) -> float | None:
-        if val is None:
-            return None
-        s = str(val).strip()
-        if s == "" or s.lower() in {"unknown", "na", "n/a", "-"}:
-            return None
-        # Remove thousands apostrophes commonly used in Swiss formatting (e.g. 2'847'611.40)
-        s = s.replace("'", "")
-        try:
-            return float(s)
-        except Exception:
-            return None
-
-    for r in rows:
-        weight = safe_float(r.get("weight_pct"))
-        if weight is None:
-            # If weight missing/unparseable, treat as 0.0 (and log a warning)
-            logger.warning("Unparseable weight_pct for row: %s", r.get("security_name_report"))
-            weight = 0.0
-
-        mapping_conf = safe_float(r.get("mapping_confidence"))
-
-        holding = PortfolioHolding(
+    # Numeric columns are parsed in bulk rather than cell by cell; weights stay
+    # an array so the total below is a single reduction
+    weight_arr = _parse_numeric_column(df, "weight_pct")
+    unparseable_weight = np.isnan(weight_arr)
+    # If weight missing/unparseable, treat as 0.0 (and log a warning); the
+    # warnings are issued only when WARNING is enabled, outside the row loop
+    if unparseable_weight.any():
+        weight_arr[unparseable_weight] = 0.0
+        if logger.isEnabledFor(logging.WARNING):
+            bad_names = (
+                df["security_name_report"].to_numpy()[unparseable_weight].tolist()
+                if "security_name_report" in df.columns
+                else [None] * int(unparseable_weight.sum())
+            )
+            for name in bad_names:
+                logger.warning("Unparseable weight_pct for row: %s", name)
+    betas = _optional_floats(_parse_numeric_column(df, "gpr_beta"))
+    sentiments = _optional_floats(_parse_numeric_column(df, "gpr_sentiment"))
+    mapping_confs = _optional_floats(_parse_numeric_column(df, "mapping_confidence"))
+
+    for r, weight, beta, sentiment, mapping_conf in zip(
+        df.to_dict(orient="records"), weight_arr.tolist(), betas, sentiments, mapping_confs
+    ):
+
+        # Every value is already str/float/None as the fields declare, so skip
+        # pydantic validation on this trusted, post-cleaning path
+        holding = PortfolioHolding.model_construct(
             security_name_report=r.get("security_name_report") or "",
             ticker_guess=r.get("ticker_guess") or None,
             isin_guess=r.get("isin_guess") or None,
             sector_raw=r.get("sector_raw") or None,
-            weight_pct=float(weight),
+            weight_pct=weight,
             market_value_raw=r.get("market_value_raw") or None,
             fed_industry_name=r.get("fed_industry_name") or None,
             fed_industry_id=r.get("fed_industry_id") or None,
-            gpr_beta=safe_float(r.get("gpr_beta")),
-            gpr_sentiment=safe_float(r.get("gpr_sentiment")),
-            mapping_confidence=float(mapping_conf) if mapping_conf is not None else None,
+            gpr_beta=beta,
+            gpr_sentiment=sentiment,
+            mapping_confidence=mapping_conf,
             mapping_rationale_short=r.get("mapping_rationale_short") or None,
+            # Backwards-compatible optional fields that newer CSVs may include
+            # (region_guess / country_guess) are accepted if present and are
+            # always set (None when absent), so callers can read them directly.
+            region_guess=r.get("region_guess") or None,
+            country_guess=r.get("country_guess") or None,
         )
-        # Backwards-compatible optional fields that newer CSVs may include
-        # (region_guess / country_guess) are accepted if present.
-        # Use setattr to avoid changing constructor signature in older code.
-        if r.get("region_guess") is not None:
-            holding.region_guess = r.get("region_guess") or None
-        if r.get("country_guess") is not None:
-            holding.country_guess = r.get("country_guess") or None
         holdings.append(holding)
 
-    total_weight = sum(h.weight_pct for h in holdings)
+    total_weight = float(weight_arr.sum())
     if not (95.0 <= total_weight <= 105.0):
         logger.warning(
             "Total portfolio weight is %.2f, which is outside [95, 105]. Check the input CSV for missing or extra rows.",
@@ -232,4 +335,4 @@ def load_portfolio_snapshot_from_csv(
         len(holdings),
         total_weight,
     )
-    return snapshot
\ No newline at end of file
+    return snapshot
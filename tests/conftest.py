@@ -1,14 +1,75 @@
 """Pytest configuration helpers.
 
 Ensure the project's `src/` directory is on `sys.path` so imports like
-`from gpr_overlay...` work during test collection.
+`from gpr_overlay...` work during test collection, and share session-scoped
+fixtures for the real GPR data so it is parsed and scanned once per run.
 """
 from pathlib import Path
 import sys
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     # Insert at front so tests prefer local package sources
-    sys.path.insert(0, str(SRC))
\ No newline at end of file
+    sys.path.insert(0, str(SRC))
+
+GPR_DAILY_RECENT_CSV = ROOT / "data" / "raw" / "gpr_daily_original" / "gpr_daily_recent.csv"
+REAL_FUND_CSV = ROOT / "data" / "fund" / "blkb_iq_responsible_equity_ch_2025-09-30.csv"
+
+
+@pytest.fixture(scope="session")
+def gpr_daily_recent():
+    """Points from the full GPR daily CSV, loaded once per session.
+
+    Tests using it are skipped when the data file is not present in the checkout.
+    """
+    if not GPR_DAILY_RECENT_CSV.exists():
+        pytest.skip(f"data file not shipped: {GPR_DAILY_RECENT_CSV.relative_to(ROOT)}")
+    from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_from_csv
+
+    return load_gpr_daily_from_csv(GPR_DAILY_RECENT_CSV)
+
+
+@pytest.fixture(scope="session")
+def gpr_daily_recent_events(gpr_daily_recent):
+    """Default `detect_gpr_events` output for `gpr_daily_recent`."""
+    from gpr_overlay.services.gpr_event_detection_service import detect_gpr_events
+
+    return detect_gpr_events(gpr_daily_recent)
+
+
+@pytest.fixture(scope="session")
+def gpr_daily_recent_events_by_peak(gpr_daily_recent_events):
+    """`gpr_daily_recent_events` grouped by peak date, in detection order."""
+    by_peak = {}
+    for e in gpr_daily_recent_events:
+        by_peak.setdefault(e.peak_date, []).append(e)
+    return by_peak
+
+
+@pytest.fixture(scope="session")
+def real_fund_snapshot():
+    """Snapshot of the real BLKB fund CSV, loaded once per session.
+
+    Tests using it are skipped when the data file is not present in the checkout.
+    """
+    if not REAL_FUND_CSV.exists():
+        pytest.skip(f"data file not shipped: {REAL_FUND_CSV.relative_to(ROOT)}")
+    from gpr_overlay.services.portfolio_overlay_service import load_portfolio_snapshot_from_csv
+
+    return load_portfolio_snapshot_from_csv(REAL_FUND_CSV)
+
+
+@pytest.fixture
+def real_fund_exposures(real_fund_snapshot):
+    """`compute_portfolio_industry_exposure` output for `real_fund_snapshot`.
+
+    Function-scoped: impact computation writes `contribution_to_vulnerability`
+    into the exposures, so each test gets its own list.
+    """
+    from gpr_overlay.services.portfolio_overlay_service import compute_portfolio_industry_exposure
+
+    return compute_portfolio_industry_exposure(real_fund_snapshot)
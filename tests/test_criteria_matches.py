@@ -9,6 +9,30 @@ def _write_csv(path: Path, header: str, rows: list[str]):
     path.write_text("\n".join([header] + rows), encoding="utf-8")
 
 
+def _index_holdings(holdings):
+    # Matching logic per spec: case-insensitive exact match after strip, so each
+    # holding is normalised once into a (region, industry) key
+    index = {}
+    for h in holdings:
+        key = ((h.region_guess or "").strip().lower(), (h.fed_industry_name or "").strip().lower())
+        index.setdefault(key, []).append(h)
+    return index
+
+
+def _match_records(index, crit):
+    key = (crit["region_guess"].strip().lower(), crit["industry_name"].strip().lower())
+    return [
+        {
+            "security_name_report": h.security_name_report,
+            "weight_pct": h.weight_pct,
+            "fed_industry_name": h.fed_industry_name,
+            "region_guess": h.region_guess,
+            "country_guess": h.country_guess,
+        }
+        for h in index.get(key, [])
+    ]
+
+
 def test_criteria_top_level_list_matching(tmp_path):
     p = tmp_path / "fund.csv"
     header = (
@@ -31,21 +55,11 @@ def test_criteria_top_level_list_matching(tmp_path):
     crit_file = tmp_path / "crit.json"
     crit_file.write_text(json.dumps(criteria), encoding="utf-8")
 
-    # Matching logic per spec: case-insensitive exact match after strip
     parsed = json.loads(crit_file.read_text(encoding="utf-8"))
+    index = _index_holdings(snap.holdings)
     matches = []
     for crit in parsed:
-        for h in snap.holdings:
-            h_region = (getattr(h, "region_guess", "") or "").strip()
-            h_ind = (h.fed_industry_name or "").strip()
-            if h_region.lower() == crit["region_guess"].strip().lower() and h_ind.lower() == crit["industry_name"].strip().lower():
-                matches.append({
-                    "security_name_report": h.security_name_report,
-                    "weight_pct": h.weight_pct,
-                    "fed_industry_name": h.fed_industry_name,
-                    "region_guess": getattr(h, "region_guess", None),
-                    "country_guess": getattr(h, "country_guess", None),
-                })
+        matches.extend(_match_records(index, crit))
 
     assert len(matches) == 2
     assert any(m["security_name_report"] == "Comp A" for m in matches)
@@ -95,19 +109,10 @@ def test_criteria_flow1_format_matching(tmp_path):
                 if cid and region and ind:
                     parsed_criteria.append({"cluster_id": cid, "region_guess": region, "industry_name": ind})
 
+    index = _index_holdings(snap.holdings)
     matches = []
     for crit in parsed_criteria:
-        for h in snap.holdings:
-            h_region = (getattr(h, "region_guess", "") or "").strip()
-            h_ind = (h.fed_industry_name or "").strip()
-            if h_region.lower() == crit["region_guess"].strip().lower() and h_ind.lower() == crit["industry_name"].strip().lower():
-                matches.append({
-                    "security_name_report": h.security_name_report,
-                    "weight_pct": h.weight_pct,
-                    "fed_industry_name": h.fed_industry_name,
-                    "region_guess": getattr(h, "region_guess", None),
-                    "country_guess": getattr(h, "country_guess", None),
-                })
+        matches.extend(_match_records(index, crit))
 
     assert len(matches) == 1
     assert matches[0]["security_name_report"] == "Comp Y"
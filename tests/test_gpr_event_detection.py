@@ -1,32 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from typing import List
 
+import numpy as np
 import pytest
 
-from gpr_overlay.data_models.gpr_series import GprDailyPoint
-from gpr_overlay.services.gpr_event_detection_service import detect_gpr_events
+from gpr_overlay.data_models.gpr_series import GprDailyPoint, GprDailySeries
+from gpr_overlay.services import gpr_event_detection_service as svc
+from gpr_overlay.services.gpr_event_detection_service import detect_gpr_events, detect_gpr_events_batch
 from gpr_overlay.data_models.gpr_event import GprEventType
-from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_from_csv
 from gpr_overlay.services.gpr_event_detection_service import ELEVATED_SPIKE_Q, EXTREME_SPIKE_Q, BUFFER_PRE_DAYS_DEFAULT, BUFFER_POST_DAYS_DEFAULT
 
 
 def _build_series(start_date: date, values: List[float]) -> List[GprDailyPoint]:
-    points: List[GprDailyPoint] = []
-    for i, val in enumerate(values):
-        d = start_date + timedelta(days=i)
-        points.append(
-            GprDailyPoint(
-                date=d,
-                n10d=None,
-                gprd=float(val),
-                gprd_act=None,
-                gprd_threat=None,
-                gprd_ma30=None,
-                gprd_ma7=None,
-                event=None,
-            )
+    # Consecutive days as one datetime64 range, converted to `date` objects in bulk
+    dates = (np.datetime64(start_date, "D") + np.arange(len(values))).tolist()
+    return [
+        GprDailyPoint(
+            date=d,
+            n10d=None,
+            gprd=float(val),
+            gprd_act=None,
+            gprd_threat=None,
+            gprd_ma30=None,
+            gprd_ma7=None,
+            event=None,
         )
-    return points
+        for d, val in zip(dates, values)
+    ]
 
 
 def test_detect_short_term_spike_simple():
@@ -44,11 +45,18 @@ def test_detect_short_term_spike_simple():
     assert spikes[0].gpr_delta_from_baseline > 0.0
 
 
-def test_no_spikes_on_flat_series():
-    start = date(2000, 1, 1)
-    # small noise around 50
-    vals = [50.0 + ((i % 3) - 1) * 0.5 for i in range(60)]
-    pts = _build_series(start, vals)
+@pytest.mark.parametrize(
+    "vals",
+    [
+        # small noise around 50
+        [50.0 + ((i % 3) - 1) * 0.5 for i in range(60)],
+        # fewer than 30 days of history -> spike detector requires 30-day rolling stats
+        [50.0] * 20 + [200.0] + [50.0] * 5,
+    ],
+    ids=["flat_series", "insufficient_history"],
+)
+def test_no_short_term_spikes(vals):
+    pts = _build_series(date(2000, 1, 1), vals)
 
     events = detect_gpr_events(pts)
     spikes = [e for e in events if e.event_type == GprEventType.SHORT_TERM_SPIKE]
@@ -94,17 +102,6 @@ def test_regime_detection():
     assert reg.gpr_level_at_peak >= 85.0
 
 
-def test_no_spike_if_insufficient_history():
-    # fewer than 30 days of history -> spike detector requires 30-day rolling stats
-    start = date(2000, 1, 1)
-    vals = [50.0] * 20 + [200.0] + [50.0] * 5
-    pts = _build_series(start, vals)
-
-    events = detect_gpr_events(pts)
-    spikes = [e for e in events if e.event_type == GprEventType.SHORT_TERM_SPIKE]
-    assert len(spikes) == 0
-
-
 def test_episode_length_boundary():
     start = date(2000, 1, 1)
     # Ensure the 10-day plateau produces at least one episode, and that
@@ -131,14 +128,10 @@ def test_episode_length_boundary():
         assert 0.0 <= e.severity_score <= 1.0
 
 
-def test_june_23_2025_demo_peak_classification():
-    # Integration-style test: load the real GPR CSV and assert that 2025-06-23 appears as a quantile spike
-    pts = load_gpr_daily_from_csv("data/raw/gpr_daily_original/gpr_daily_recent.csv")
-    events = detect_gpr_events(pts)
-
-    # Look for event(s) with peak_date == 2025-06-23
-    from datetime import date
-    matches = [e for e in events if e.peak_date == date(2025, 6, 23)]
+def test_june_23_2025_demo_peak_classification(gpr_daily_recent_events_by_peak):
+    # Integration-style test: on the real GPR CSV, 2025-06-23 should appear as a quantile spike
+    # Look up event(s) with peak_date == 2025-06-23
+    matches = gpr_daily_recent_events_by_peak.get(date(2025, 6, 23), [])
     assert len(matches) >= 1, "Expected at least one detected event with peak_date 2025-06-23"
     ev = matches[0]
     assert ev.event_type in (GprEventType.ELEVATED_SPIKE, GprEventType.EXTREME_SPIKE)
@@ -148,3 +141,58 @@ def test_june_23_2025_demo_peak_classification():
     expected_end = date(2025, 6, 23) + timedelta(days=BUFFER_POST_DAYS_DEFAULT)
     assert ev.start_date == expected_start
     assert ev.end_date == expected_end
+
+
+def test_detect_gpr_events_batch_matches_single_calls():
+    start = date(2000, 1, 1)
+    series = [
+        _build_series(start, [50.0] * 40 + [120.0] + [50.0] * 39),
+        _build_series(start, [50.0 + ((i % 3) - 1) * 0.5 for i in range(60)]),
+        [],
+    ]
+
+    expected = [detect_gpr_events(pts) for pts in series]
+
+    class _UnusedExecutor:
+        def map(self, fn, *iterables):
+            raise AssertionError("batch below min_parallel should run in-process")
+
+    assert detect_gpr_events_batch(series, min_parallel=4, executor=_UnusedExecutor()) == expected
+    # A thread pool stands in for the default process pool on the pooled branch
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert detect_gpr_events_batch(series, min_parallel=2, executor=executor) == expected
+
+
+def test_detect_gpr_events_accepts_column_series():
+    start = date(2000, 1, 1)
+    vals = [50.0 + ((i % 5) - 2) * 0.5 for i in range(100)]
+    vals[40] = 120.0
+    vals[70:85] = [90.0] * 15
+    pts = _build_series(start, vals)
+
+    series = GprDailySeries.from_points(pts)
+    assert len(series) == len(pts)
+    assert detect_gpr_events(series) == detect_gpr_events(pts)
+    assert detect_gpr_events(series, include_regimes=True) == detect_gpr_events(pts, include_regimes=True)
+
+
+def test_detect_gpr_events_cache_returns_fresh_equal_lists():
+    pts = _build_series(date(2000, 1, 1), [50.0] * 40 + [120.0] + [50.0] * 39)
+
+    first = detect_gpr_events(pts, use_cache=True)
+    second = detect_gpr_events(pts, use_cache=True)
+    assert first == second == detect_gpr_events(pts)
+    # Callers may mutate the returned list without touching the cached result
+    assert first is not second
+    first.clear()
+    assert detect_gpr_events(pts, use_cache=True) == second
+
+
+def test_detect_gpr_events_cache_tracks_thresholds(monkeypatch):
+    pts = _build_series(date(2000, 1, 1), [50.0] * 40 + [120.0] + [50.0] * 39)
+    cached = detect_gpr_events(pts, use_cache=True)
+
+    monkeypatch.setattr(svc, "Z_THRESHOLD", 1e6)
+    retuned = detect_gpr_events(pts, use_cache=True)
+    assert retuned == detect_gpr_events(pts)
+    assert retuned != cached
@@ -1,10 +1,10 @@
-from pathlib import Path
+import pytest
+
 from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_from_csv
 
 
-def test_load_gpr_daily_from_csv_basic():
-    csv_path = Path("data/raw/gpr_daily_original/gpr_daily_recent.csv")
-    points = load_gpr_daily_from_csv(csv_path)
+def test_load_gpr_daily_from_csv_basic(gpr_daily_recent):
+    points = gpr_daily_recent
 
     # Basic sanity checks
     assert len(points) > 0
@@ -13,3 +13,50 @@ def test_load_gpr_daily_from_csv_basic():
 
     assert isinstance(first.date, _date)
     assert isinstance(first.gprd, float)
+
+
+def test_load_gpr_daily_df_feather_cache_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    from gpr_overlay.services.gpr_ingestion_service import gpr_points_from_df, load_gpr_daily_df
+
+    csv_path = tmp_path / "gpr.csv"
+    sidecar = csv_path.with_suffix(".feather")
+    csv_path.write_text(
+        "DATE,GPRD,GPRD_MA7,EVENT\n2025-06-20,100.5,,\n2025-06-21,120.0,110.25,strike\n",
+        encoding="utf-8",
+    )
+
+    expected = load_gpr_daily_from_csv(csv_path)
+    df = load_gpr_daily_df(csv_path)
+    # The sidecar is opt-in
+    assert not sidecar.exists()
+    assert list(df.columns) == ["DATE", "GPRD", "GPRD_MA7", "EVENT"]
+    assert str(df["DATE"].dtype).startswith("datetime64")
+
+    first = gpr_points_from_df(load_gpr_daily_df(csv_path, use_feather_cache=True))
+    assert sidecar.exists()
+    second = gpr_points_from_df(load_gpr_daily_df(csv_path, use_feather_cache=True))
+    assert first == expected
+    assert second == expected
+    assert load_gpr_daily_from_csv(csv_path, use_feather_cache=True) == expected
+    # Only the sidecar itself is left behind, no temporary files
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["gpr.csv", "gpr.feather"]
+
+
+def test_load_gpr_daily_df_feather_cache_detects_older_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    import os
+
+    from gpr_overlay.services.gpr_ingestion_service import load_gpr_daily_df
+
+    csv_path = tmp_path / "gpr.csv"
+    csv_path.write_text("DATE,GPRD\n2025-06-20,100.5\n", encoding="utf-8")
+    load_gpr_daily_df(csv_path, use_feather_cache=True)
+
+    # Restore a different CSV with an mtime older than the sidecar
+    csv_path.write_text("DATE,GPRD\n2025-06-20,200.5\n", encoding="utf-8")
+    old = csv_path.with_suffix(".feather").stat().st_mtime - 3600
+    os.utime(csv_path, (old, old))
+
+    df = load_gpr_daily_df(csv_path, use_feather_cache=True)
+    assert df["GPRD"].tolist() == [200.5]
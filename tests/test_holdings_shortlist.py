@@ -2,7 +2,11 @@ from pathlib import Path
 from datetime import date
 import json
 
-from gpr_overlay.services.portfolio_overlay_service import load_portfolio_snapshot_from_csv, compute_portfolio_industry_exposure
+from gpr_overlay.services.portfolio_overlay_service import (
+    compute_industry_shortlists,
+    compute_portfolio_industry_exposure,
+    load_portfolio_snapshot_from_csv,
+)
 from gpr_overlay.services.industry_impact_service import compute_event_portfolio_impact
 from gpr_overlay.data_models.gpr_event import GprEvent, GprEventType
 
@@ -52,35 +56,25 @@ def test_shortlist_top_n_per_industry(tmp_path):
         assert hasattr(it, "industry_weight_share_of_vulnerable")
         assert 0.0 <= (it.industry_weight_share_of_vulnerable or 0.0) <= 1.0
 
-    # Build shortlists per spec: group by fed_industry_name, sort by weight_pct desc, top N per industry
+    # Shortlists per spec: group by fed_industry_name, top N per industry by weight_pct desc
     per_industry = 2
-    holdings_list = [
-        {
-            "security_name_report": h.security_name_report,
-            "weight_pct": h.weight_pct,
-            "fed_industry_name": h.fed_industry_name,
-            "region_guess": getattr(h, "region_guess", None),
-            "country_guess": getattr(h, "country_guess", None),
-        }
-        for h in snap.holdings
-    ]
 
     # Select industries in union (vulnerable+resilient)
     sel_names = {it.fed_industry_name for it in (profile.vulnerable_industries + profile.resilient_industries)}
 
-    # Group and sort
-    from collections import defaultdict
-
-    by_ind = defaultdict(list)
-    for h in holdings_list:
-        name = h.get("fed_industry_name") or "__unknown__"
-        if name in sel_names:
-            by_ind[name].append(h)
-
-    shortlists = {}
-    for ind, items in by_ind.items():
-        items_sorted = sorted(items, key=lambda x: float(x.get("weight_pct") or 0.0), reverse=True)
-        shortlists[ind] = items_sorted[:per_industry]
+    shortlists = {
+        ind: [
+            {
+                "security_name_report": h.security_name_report,
+                "weight_pct": h.weight_pct,
+                "fed_industry_name": h.fed_industry_name,
+                "region_guess": h.region_guess,
+                "country_guess": h.country_guess,
+            }
+            for h in items
+        ]
+        for ind, items in compute_industry_shortlists(snap, sel_names, per_industry).items()
+    }
 
     # Assertions:
     # Industry A should have top 2: Comp A (40), Comp B (30)
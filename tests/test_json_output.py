@@ -0,0 +1,36 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from gpr_overlay.cli import json_output
+from gpr_overlay.data_models.gpr_event import GprEvent, GprEventType
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    event = GprEvent(
+        event_id="extreme_spike_2025-06-23",
+        event_type=GprEventType.EXTREME_SPIKE,
+        start_date=date(2025, 6, 16),
+        end_date=date(2025, 6, 25),
+        peak_date=date(2025, 6, 23),
+        gpr_level_at_peak=310.5,
+        gpr_delta_from_baseline=180.25,
+        severity_score=0.9,
+        percentile=0.997,
+        label="Zölle – Eskalation",
+    )
+    obj = {
+        "fund_name": "Zürcher Kantonalbank – Aktien Schweiz",
+        "as_of_date": date(2025, 9, 30),
+        "weights": np.array([12.5, 7.25]),
+        "beta": np.float64(0.5),
+        "count": np.int64(3),
+        "event": event,
+        "empty": [],
+    }
+
+    expected = json_output.dumps_json_bytes(obj)
+    monkeypatch.setattr(json_output, "orjson", None)
+    assert json_output.dumps_json_bytes(obj) == expected
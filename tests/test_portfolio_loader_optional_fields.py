@@ -1,6 +1,11 @@
+from datetime import date
 from pathlib import Path
 import json
-from gpr_overlay.services.portfolio_overlay_service import load_portfolio_snapshot_from_csv
+from gpr_overlay.data_models.portfolio_snapshot import PortfolioHolding, PortfolioSnapshot
+from gpr_overlay.services.portfolio_overlay_service import (
+    compute_portfolio_industry_exposure,
+    load_portfolio_snapshot_from_csv,
+)
 
 
 def _write_csv(path: Path, header: str, rows: list[str]):
@@ -45,3 +50,75 @@ def test_loader_with_region_country(tmp_path):
     h = snap.holdings[0]
     assert getattr(h, "region_guess") == "Switzerland"
     assert getattr(h, "country_guess") == "CH"
+
+
+def test_loader_ignores_empty_fund_fields_in_short_rows(tmp_path):
+    p = tmp_path / "fund_short.csv"
+    header = "security_name_report,weight_pct,fed_industry_id,gpr_beta,fund_name,as_of_date"
+    rows = [
+        "Company A,60.0,IND1,0.5,F,2025-09-30",
+        # Short row: the trailing fund_name / as_of_date fields are missing
+        "Company B,40.0,IND2,0.1",
+    ]
+    _write_csv(p, header, rows)
+
+    snap = load_portfolio_snapshot_from_csv(p)
+    assert snap.fund_name == "F"
+    assert snap.as_of_date == date(2025, 9, 30)
+    assert [h.security_name_report for h in snap.holdings] == ["Company A", "Company B"]
+
+
+def test_holdings_df_matches_holdings(tmp_path):
+    p = tmp_path / "fund3.csv"
+    header = (
+        "fund_name,as_of_date,security_name_report,ticker_guess,weight_pct,"
+        "fed_industry_id,fed_industry_name,gpr_beta,region_guess,country_guess"
+    )
+    rows = [
+        "Demo Fund,2025-09-30,Company C,C,20.0,IND1,Industry One,0.8,Switzerland,CH",
+        "Demo Fund,2025-09-30,Company D,D,10.0,IND2,Industry Two,0.1,,",
+    ]
+    _write_csv(p, header, rows)
+
+    snap = load_portfolio_snapshot_from_csv(p)
+    hdf = snap.holdings_df
+    assert list(hdf["security_name_report"]) == ["Company C", "Company D"]
+    assert list(hdf["weight_pct"]) == [20.0, 10.0]
+    assert hdf["region_guess"].iloc[1] is None
+    # Cached on the snapshot
+    assert snap.holdings_df is hdf
+
+
+def _holding(name: str, weight: float, industry: str) -> PortfolioHolding:
+    return PortfolioHolding(
+        security_name_report=name, weight_pct=weight, fed_industry_id=industry, fed_industry_name=industry, gpr_beta=0.5
+    )
+
+
+def _exposure_weights(snapshot: PortfolioSnapshot) -> list[float]:
+    return [e.portfolio_weight for e in compute_portfolio_industry_exposure(snapshot)]
+
+
+def _primed_snapshot() -> PortfolioSnapshot:
+    snap = PortfolioSnapshot(fund_name="Demo Fund", as_of_date=date(2025, 9, 30), holdings=[_holding("A", 50.0, "I1")])
+    assert _exposure_weights(snap) == [50.0]
+    return snap
+
+
+def test_holdings_df_tracks_appended_holding():
+    snap = _primed_snapshot()
+    snap.holdings.append(_holding("B", 30.0, "I2"))
+    assert _exposure_weights(snap) == [50.0, 30.0]
+
+
+def test_holdings_df_tracks_reassigned_holdings():
+    snap = _primed_snapshot()
+    snap.holdings = [_holding("B", 30.0, "I2")]
+    assert _exposure_weights(snap) == [30.0]
+
+
+def test_holdings_df_tracks_model_copy_update():
+    snap = _primed_snapshot()
+    copy = snap.model_copy(update={"holdings": [_holding("B", 30.0, "I2")]})
+    assert _exposure_weights(copy) == [30.0]
+    assert _exposure_weights(snap) == [50.0]
@@ -1,10 +1,8 @@
-from pathlib import Path
-from gpr_overlay.services.portfolio_overlay_service import load_portfolio_snapshot_from_csv
+import pytest
 
 
-def test_load_portfolio_snapshot_from_csv_basic():
-    csv_path = Path("data/fund/blkb_iq_responsible_equity_ch_2025-09-30.csv")
-    snapshot = load_portfolio_snapshot_from_csv(csv_path)
+def test_load_portfolio_snapshot_from_csv_basic(real_fund_snapshot):
+    snapshot = real_fund_snapshot
 
     assert snapshot.fund_name
     assert snapshot.holdings
@@ -19,3 +17,14 @@ def test_load_portfolio_snapshot_from_csv_basic():
         for h in snapshot.holdings
     )
     assert has_industry_info
+
+
+def test_real_fund_exposures_cover_mapped_weight(real_fund_snapshot, real_fund_exposures):
+    # Exposures aggregate exactly the holdings that carry an industry id and a beta
+    mapped_weight = sum(
+        h.weight_pct
+        for h in real_fund_snapshot.holdings
+        if h.fed_industry_id is not None and h.gpr_beta is not None
+    )
+    assert real_fund_exposures
+    assert sum(e.portfolio_weight for e in real_fund_exposures) == pytest.approx(mapped_weight)
@@ -1,4 +1,4 @@
-from datetime import date, timedelta
+from datetime import date
 from typing import List
 import math
 
@@ -6,27 +6,26 @@ import numpy as np
 
 from gpr_overlay.data_models.gpr_series import GprDailyPoint
 from gpr_overlay.data_models.gpr_event import GprEventType
-from gpr_overlay.services.gpr_event_detection_service import detect_gpr_events
+from gpr_overlay.services.gpr_event_detection_service import detect_gpr_events, detect_gpr_events_batch
 
 
 def _build_series(start_date: date, values: List[float]) -> List[GprDailyPoint]:
     """Helper to build a synthetic GprDailyPoint time series from scalar values."""
-    points: List[GprDailyPoint] = []
-    for i, val in enumerate(values):
-        d = start_date + timedelta(days=i)
-        points.append(
-            GprDailyPoint(
-                date=d,
-                n10d=None,
-                gprd=float(val),
-                gprd_act=None,
-                gprd_threat=None,
-                gprd_ma30=None,
-                gprd_ma7=None,
-                event=None,
-            )
+    # Consecutive days as one datetime64 range, converted to `date` objects in bulk
+    dates = (np.datetime64(start_date, "D") + np.arange(len(values))).tolist()
+    return [
+        GprDailyPoint(
+            date=d,
+            n10d=None,
+            gprd=float(val),
+            gprd_act=None,
+            gprd_threat=None,
+            gprd_ma30=None,
+            gprd_ma7=None,
+            event=None,
         )
-    return points
+        for d, val in zip(dates, values)
+    ]
 
 
 def test_spike_severity_monotonicity():
@@ -48,8 +47,7 @@ def test_spike_severity_monotonicity():
     pts_a = _build_series(start, vals_a)
     pts_b = _build_series(start, vals_b)
 
-    events_a = detect_gpr_events(pts_a)
-    events_b = detect_gpr_events(pts_b)
+    events_a, events_b = detect_gpr_events_batch([pts_a, pts_b])
 
     spikes_a = [e for e in events_a if e.event_type == GprEventType.SHORT_TERM_SPIKE]
     spikes_b = [e for e in events_b if e.event_type == GprEventType.SHORT_TERM_SPIKE]
@@ -85,8 +83,7 @@ def test_baseline_sensitivity():
     pts1 = _build_series(start, vals1)
     pts2 = _build_series(start, vals2)
 
-    ev1 = detect_gpr_events(pts1)
-    ev2 = detect_gpr_events(pts2)
+    ev1, ev2 = detect_gpr_events_batch([pts1, pts2])
 
     spikes1 = [e for e in ev1 if e.event_type == GprEventType.SHORT_TERM_SPIKE]
     spikes2 = [e for e in ev2 if e.event_type == GprEventType.SHORT_TERM_SPIKE]
@@ -107,17 +104,15 @@ def test_range_and_numeric_sanity():
     - percentile in [0,100]
     - key numeric fields are not NaN
     """
-    np.random.seed(123)
+    rng = np.random.default_rng(123)
     start = date(2021, 1, 1)
     n = 200
 
     # baseline 50 with light noise
-    noise = np.random.normal(scale=1.5, size=n)
-    vals = [50.0 + float(noise[i]) for i in range(n)]
+    vals = 50.0 + rng.normal(scale=1.5, size=n)
 
     # Inject a few spikes at deterministic positions
-    for idx, add in [(50, 40.0), (120, 60.0), (160, 80.0)]:
-        vals[idx] = float(vals[idx] + add)
+    vals[[50, 120, 160]] += [40.0, 60.0, 80.0]
 
     pts = _build_series(start, vals)
     events = detect_gpr_events(pts)
@@ -56,9 +56,8 @@ def test_impact_sign_and_ordering():
             assert ind.impact_score > 0
 
     # ordering: among the negative betas, A has larger |beta| than B, so |impact_A| > |impact_B|
-    neg = [i for i in profile.industries if i.gpr_beta < 0]
-    a = next(i for i in neg if i.fed_industry_name == "A")
-    b = next(i for i in neg if i.fed_industry_name == "B")
+    neg_by_name = {i.fed_industry_name: i for i in profile.industries if i.gpr_beta < 0}
+    a, b = neg_by_name["A"], neg_by_name["B"]
     assert abs(a.impact_score) > abs(b.impact_score)
 
 
@@ -1,4 +1,5 @@
 from datetime import date
+import math
 
 import pytest
 
@@ -30,15 +31,11 @@ def test_linearity_under_normalization():
     v1 = compute_portfolio_gpr_vulnerability(exposures1)
 
     # Uniformly scale raw weights by 2 (simulating raw non-normalized input)
-    scaled_holdings = []
-    for h in holdings:
-        scaled_holdings.append(PortfolioHolding(**{**h.model_dump(), "weight_pct": h.weight_pct * 2.0}))
+    scaled_holdings = [h.model_copy(update={"weight_pct": h.weight_pct * 2.0}) for h in holdings]
 
     # Renormalize to 100% to compare the meaningful portfolio
-    total = sum(h.weight_pct for h in scaled_holdings)
-    normalized = []
-    for h in scaled_holdings:
-        normalized.append(PortfolioHolding(**{**h.model_dump(), "weight_pct": h.weight_pct * (100.0 / total)}))
+    total = math.fsum(h.weight_pct for h in scaled_holdings)
+    normalized = [h.model_copy(update={"weight_pct": h.weight_pct * (100.0 / total)}) for h in scaled_holdings]
 
     snap2 = PortfolioSnapshot(fund_name="F", as_of_date=date(2025, 1, 1), holdings=normalized)
     exposures2 = compute_portfolio_industry_exposure(snap2)